@@ -0,0 +1,142 @@
+from manim import *
+import numpy as np
+
+
+def nice_step(span, max_ticks=8):
+    """Smallest 1, 2 or 5 x 10^k step that splits span into at most max_ticks - 1 parts"""
+    magnitude = 10 ** np.floor(np.log10(max(span, 1e-9) / (max_ticks - 1)))
+    for multiple in (1, 2, 5, 10):
+        if span / (multiple * magnitude) <= max_ticks - 1:
+            return multiple * magnitude
+
+
+class AxisScale:
+    """
+    Maps data values onto the span [start, end] of an axis in manim
+    coordinates, linearly or logarithmically. A log scale maps v to
+    log10(v - min_value + 1), so min_value sits at the start of the axis
+    and the axis ends at the next power of ten. Integer scales get no
+    major or minor ticks finer than 1.
+    """
+
+    def __init__(self, start, end, max_value, min_value=0, log=False, integer=False):
+        self.start = start
+        self.end = end
+        self.min_value = min_value
+        self.log = log
+        self.integer = integer
+        if log:
+            self.max_value = 10 ** np.ceil(np.log10(max(max_value, 10)))
+        else:
+            step = self._step(max_value - min_value)
+            self.max_value = min_value + step * max(np.ceil((max_value - min_value) / step), 1)
+
+    def _step(self, span):
+        step = nice_step(span)
+        return max(step, 1) if self.integer else step
+
+    def _transform(self, values):
+        values = np.asarray(values, dtype=float) - self.min_value
+        return np.log10(values + 1) if self.log else values
+
+    def __call__(self, values):
+        fraction = self._transform(values) / self._transform(self.max_value)
+        return self.start + fraction * (self.end - self.start)
+
+    def ticks(self):
+        """Return (major tick values, minor tick values)"""
+        if self.log:
+            decades = 10 ** np.arange(round(np.log10(self.max_value)) + 1)
+            major = decades[decades >= self.min_value]
+            if self.min_value < 1:
+                major = np.concatenate([[self.min_value], major])
+            minor = np.array([d * decade for decade in decades[:-1] for d in range(2, 10)])
+            return major, minor[minor >= self.min_value]
+        span = self.max_value - self.min_value
+        step = self._step(span)
+        leading = round(step / 10 ** np.floor(np.log10(step)))
+        minor_step = step / 2 if leading == 2 else step / 5
+        if self.integer:
+            minor_step = max(minor_step, 1)
+        major = self.min_value + np.arange(round(span / step) + 1) * step
+        minor = self.min_value + np.arange(round(span / minor_step) + 1) * minor_step
+        return major, minor
+
+
+class AnimatedHistogram(VGroup):
+    """
+    Histogram with a fixed pool of bars that are resized in place.
+
+    Bars are created once; updating the counts only touches the bars whose
+    count changed, and animates them by rewriting their corners rather than
+    allocating and transforming into new rectangles.
+    """
+
+    def __init__(self, bar_centers, bar_width, baseline, height_per_count=None,
+                 count_to_height=None, fill_color=WHITE, fill_opacity=1, **kwargs):
+        super().__init__(**kwargs)
+        self.bar_centers = np.asarray(bar_centers, dtype=float)  # x of each bar center
+        # One width for all bars or one per bar
+        self.bar_widths = np.broadcast_to(np.asarray(bar_width, dtype=float), self.bar_centers.shape)
+        self.baseline = baseline  # y of the bar bottoms
+        # Bar heights are linear in the count unless a mapping is given (e.g. an AxisScale)
+        if count_to_height is None:
+            count_to_height = lambda count: count * height_per_count
+        self.count_to_height = count_to_height
+        self.counts = np.zeros(len(self.bar_centers))
+        for width in self.bar_widths:
+            self.add(Rectangle(width=width, height=0, fill_color=fill_color,
+                               fill_opacity=fill_opacity, stroke_width=0))
+        for i in range(len(self.bar_centers)):
+            self._set_bar_height(i, 0)
+
+    def _set_bar_height(self, i, height):
+        left = self.bar_centers[i] - self.bar_widths[i] / 2
+        right = left + self.bar_widths[i]
+        bottom = self.baseline
+        top = bottom + height
+        self.submobjects[i].set_points_as_corners([
+            [left, bottom, 0], [right, bottom, 0], [right, top, 0],
+            [left, top, 0], [left, bottom, 0],
+        ])
+
+    def set_counts(self, counts):
+        """Jump to new counts without animating"""
+        counts = np.asarray(counts, dtype=float)
+        for i in np.flatnonzero(counts != self.counts):
+            self._set_bar_height(i, self.count_to_height(counts[i]))
+        self.counts = counts
+        return self
+
+    def show_between(self, start_counts, end_counts, alpha):
+        """
+        Draw the bars a fraction alpha of the way from start_counts to
+        end_counts, touching only the bars that differ. For driving the
+        histogram from an external timeline; call set_counts(end_counts)
+        once the transition is over.
+        """
+        start_counts = np.asarray(start_counts, dtype=float)
+        end_counts = np.asarray(end_counts, dtype=float)
+        for i in np.flatnonzero(start_counts != end_counts):
+            count = interpolate(start_counts[i], end_counts[i], alpha)
+            self._set_bar_height(i, self.count_to_height(count))
+        return self
+
+    def animate_counts(self, counts, run_time=1):
+        """
+        Return animations that grow or shrink the bars whose count changed.
+        The list is empty when nothing changed.
+        """
+        counts = np.asarray(counts, dtype=float)
+        animations = []
+        for i in np.flatnonzero(counts != self.counts):
+            start = self.counts[i]
+            end = counts[i]
+            animations.append(UpdateFromAlphaFunc(
+                self.submobjects[i],
+                lambda bar, alpha, i=i, start=start, end=end:
+                    self._set_bar_height(i, self.count_to_height(interpolate(start, end, alpha))),
+                run_time=run_time,
+            ))
+        self.counts = counts
+        return animations
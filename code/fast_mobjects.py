@@ -0,0 +1,157 @@
+from manim import *
+import numpy as np
+
+
+def segment_points(starts, ends):
+    """Bezier control points drawing straight segments starts[i] -> ends[i]"""
+    starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+    # Straight cubic curve: handles at 1/3 and 2/3 of the way
+    weights = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+    return (starts[:, None, :] + weights * (ends - starts)[:, None, :]).reshape(-1, 3)
+
+
+def circle_points(centers, radius):
+    """Bezier control points of one closed circle around each center"""
+    centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+    template = Circle(radius=radius, num_components=5).points  # 4 cubic curves
+    return (centers[:, None, :] + template[None, :, :]).reshape(-1, 3)
+
+
+def corner_points(points):
+    """Bezier control points of the polyline through points, as set_points_as_corners builds"""
+    points = np.asarray(points, dtype=float)
+    return segment_points(points[:-1], points[1:])
+
+
+def pixel_size(frame_width=None, pixel_width=None):
+    """Scene units per output pixel; defaults to the current render config"""
+    return (frame_width or config.frame_width) / (pixel_width or config.pixel_width)
+
+
+def simplify_mask(points, tolerance):
+    """
+    Pixel-grid decimation of a polyline: snap vertices to a grid of cell
+    size tolerance and keep only the first vertex of every run of
+    consecutive vertices in the same cell (plus the last vertex). Kept
+    vertices stay within one cell diagonal of the dropped ones.
+    """
+    points = np.asarray(points, dtype=float)
+    cells = np.floor(points[:, :2] / tolerance).astype(np.int64)
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:] = (cells[1:] != cells[:-1]).any(axis=1)
+    keep[-1] = True
+    return keep
+
+
+def simplify_curve(points, frame_width=None, pixel_width=None, pixels=1):
+    """
+    Drop polyline vertices closer together than `pixels` output pixels,
+    for a camera frame frame_width units wide rendered pixel_width pixels
+    wide. Only for curves whose point count does not need to match another.
+    """
+    points = np.asarray(points, dtype=float)
+    return points[simplify_mask(points, pixels * pixel_size(frame_width, pixel_width))]
+
+
+class InPlaceAnimation(Animation):
+    """
+    Animation that sets its mobject's state directly from alpha on every
+    frame. There is no starting copy to interpolate from, so none is made,
+    which matters for mobjects holding a whole network or many particles.
+    """
+    
+    def create_starting_mobject(self):
+        return self.mobject
+
+
+class MorphPoints(InPlaceAnimation):
+    """
+    Morph a mobject's own point array into target_points in place.
+    
+    Start and target arrays are interpolated directly; no target mobject
+    is built and the mobject is not copied. If the point counts differ the
+    mobject simply takes the target points.
+    """
+    
+    def __init__(self, mobject, target_points, **kwargs):
+        self.target_points = np.asarray(target_points, dtype=float)
+        super().__init__(mobject, **kwargs)
+    
+    def begin(self):
+        self.start_points = self.mobject.points.copy()
+        if self.start_points.shape != self.target_points.shape:
+            self.start_points = self.target_points
+        super().begin()
+    
+    def interpolate_mobject(self, alpha):
+        self.mobject.points = interpolate(self.start_points, self.target_points, self.rate_func(alpha))
+
+
+class BatchedVMobject(VMobject):
+    """
+    One VMobject holding many disjoint subpaths (segments, circles, ...).
+
+    Rendering a single mobject with N subpaths is much cheaper per frame
+    than N separate mobjects. Points live in a buffer that grows by
+    doubling, so appending stays amortized O(new points).
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._buffer = np.zeros((0, 3))
+
+    def append_subpaths(self, points):
+        n_old = len(self.points)
+        if self.points.base is not self._buffer:
+            # Points were replaced from outside; adopt them as the new buffer
+            self._buffer = np.array(self.points)
+        n_new = n_old + len(points)
+        if n_new > len(self._buffer):
+            buffer = np.empty((max(n_new, 2 * len(self._buffer), 256), 3))
+            buffer[:n_old] = self.points
+            self._buffer = buffer
+        self._buffer[n_old:n_new] = points
+        self.points = self._buffer[:n_new]
+        return self
+
+
+class BatchedLines(BatchedVMobject):
+    """Many straight segments drawn as one mobject"""
+
+    def add_segments(self, starts, ends):
+        return self.append_subpaths(segment_points(starts, ends))
+
+
+class BatchedDots(BatchedVMobject):
+    """Many equal circles drawn as one mobject"""
+
+    def __init__(self, radius=0.15, **kwargs):
+        super().__init__(**kwargs)
+        self.radius = radius
+
+    def add_dots(self, centers):
+        return self.append_subpaths(circle_points(centers, self.radius))
+
+
+class OutlinedDots(VGroup):
+    """
+    Many equal outlined circles as two BatchedDots: all outline discs are
+    drawn beneath all fills. A single stroked batch would stroke every
+    outline after filling every circle, so overlapping dots would show
+    rings through each other; here they merge into one outlined shape.
+    """
+
+    def __init__(self, radius=0.15, stroke_color=BLACK, stroke_width=2, fill_color=WHITE, fill_opacity=1):
+        # Cairo strokes are stroke_width / 100 scene units wide, centred on the path
+        half_width = stroke_width / 200
+        self.outlines = BatchedDots(radius=radius + half_width, stroke_width=0,
+                                    fill_color=stroke_color, fill_opacity=1)
+        self.fills = BatchedDots(radius=radius - half_width, stroke_width=0,
+                                 fill_color=fill_color, fill_opacity=fill_opacity)
+        super().__init__(self.outlines, self.fills)
+
+    def add_dots(self, centers):
+        self.outlines.add_dots(centers)
+        self.fills.add_dots(centers)
+        return self
@@ -1,7 +1,15 @@
 from manim import *
 import numpy as np
+from label_cache import label, prewarm_labels
 
 class GridTemplate(MovingCameraScene):
+    y_values = [0, 2, 4, 6, 8, 10, 12]
+    x_values = [0, 2, 4, 6, 8, 10, 12]
+    
+    def setup(self):
+        super().setup()
+        prewarm_labels([(f"y={y}", 24) for y in self.y_values] + [(f"x={x}", 24) for x in self.x_values])
+    
     def construct(self):
         # --- CAMERA SETTINGS ---
         self.camera.frame.set_width(14)
@@ -9,7 +17,7 @@ class GridTemplate(MovingCameraScene):
         self.camera.background_color = "#8bc08c"
         
         # Create horizontal white lines at various y values with width 2
-        y_values = [0, 2, 4, 6, 8, 10, 12]
+        y_values = self.y_values
         lines = []
         labels = []
         
@@ -18,22 +26,22 @@ class GridTemplate(MovingCameraScene):
             lines.append(line)
             
             # Create label at middle of line, slightly above
-            label = Text(f"y={y}", font_size=24, color=WHITE)
-            label.move_to([5, y + 0.4, 0])
-            labels.append(label)
+            y_label = label(f"y={y}", font_size=24, color=WHITE)
+            y_label.move_to([5, y + 0.4, 0])
+            labels.append(y_label)
         
         # Create vertical white lines at various x values with width 2
-        x_values = [0, 2, 4, 6, 8, 10, 12]
+        x_values = self.x_values
         
         for x in x_values:
             line = Line(start=np.array([x, 0, 0]), end=np.array([x, 12, 0]), stroke_color=WHITE, stroke_width=2)
             lines.append(line)
             
             # Create label at 1/3 the length, slightly to the right
-            label = Text(f"x={x}", font_size=24, color=WHITE)
-            label.move_to([x + 0.4, 10/3, 0])
-            labels.append(label)
+            x_label = label(f"x={x}", font_size=24, color=WHITE)
+            x_label.move_to([x + 0.4, 10/3, 0])
+            labels.append(x_label)
         
         # Display all lines and labels
-        self.play(*[Create(line) for line in lines], *[Create(label) for label in labels])
+        self.play(*[Create(line) for line in lines], *[Create(text) for text in labels])
         self.wait(2)
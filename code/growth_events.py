@@ -0,0 +1,227 @@
+import os
+import sys
+import csv
+from collections import namedtuple
+import numpy as np
+from network_layout import IncrementalLayout
+from network_stats import DegreeIndex
+
+# A growth run is stored as a directory of three .npy arrays, in arrival order:
+#   positions.npy       (N, 2) float64   x, y of every node
+#   target_offsets.npy  (N + 1,) int64   node i attaches to targets[offsets[i]:offsets[i+1]]
+#   targets.npy         (E,) int64       ids of the earlier nodes each new node connects to
+# Degrees are not stored; they follow from the targets.
+POSITIONS_FILE = 'positions.npy'
+OFFSETS_FILE = 'target_offsets.npy'
+TARGETS_FILE = 'targets.npy'
+
+# One node arrival: its id, (x, y) position and the ids of the nodes it attaches to
+GrowthEvent = namedtuple('GrowthEvent', ['node_id', 'position', 'targets'])
+
+
+class GrowthEvents:
+    """Node positions and attachment targets of a network growth run"""
+
+    def __init__(self, positions, target_offsets, targets):
+        self.positions = positions
+        self.target_offsets = target_offsets
+        self.targets = targets
+
+    def __len__(self):
+        return len(self.positions)
+
+    def targets_of(self, node_id):
+        """Ids of the nodes that node_id attaches to when it arrives"""
+        return self.targets[self.target_offsets[node_id]:self.target_offsets[node_id + 1]]
+
+    def __iter__(self):
+        """Yield one GrowthEvent per node, reading the arrays lazily"""
+        return self.between(0)
+
+    def between(self, start, stop=None):
+        """
+        Yield the GrowthEvents of nodes start..stop-1 (stop None: to the end),
+        starting directly at node start rather than reading the ones before it
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        for node_id in range(start, stop):
+            yield GrowthEvent(node_id, self.positions[node_id], self.targets_of(node_id))
+
+    def degrees(self):
+        """Final degree of every node"""
+        n_nodes = len(self)
+        return np.bincount(self.targets, minlength=n_nodes) + np.diff(self.target_offsets)
+
+    def degree_index(self):
+        """DegreeIndex for querying degrees at any step of this run"""
+        return DegreeIndex(self.target_offsets, self.targets)
+
+
+def save_growth_events(path, positions, target_offsets, targets):
+    """Write a growth run to the directory at path"""
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, POSITIONS_FILE), np.ascontiguousarray(positions, dtype=np.float64))
+    np.save(os.path.join(path, OFFSETS_FILE), np.ascontiguousarray(target_offsets, dtype=np.int64))
+    np.save(os.path.join(path, TARGETS_FILE), np.ascontiguousarray(targets, dtype=np.int64))
+
+
+def load_growth_events(path, mmap=True):
+    """Load a growth run; arrays are memory-mapped unless mmap is False"""
+    mmap_mode = 'r' if mmap else None
+    return GrowthEvents(
+        np.load(os.path.join(path, POSITIONS_FILE), mmap_mode=mmap_mode),
+        np.load(os.path.join(path, OFFSETS_FILE), mmap_mode=mmap_mode),
+        np.load(os.path.join(path, TARGETS_FILE), mmap_mode=mmap_mode),
+    )
+
+
+def barabasi_albert_targets(n_nodes, m_edges, seed=None, max_block=2**18):
+    """
+    Grow a Barabási-Albert network by preferential attachment, vectorized.
+
+    Starts from a star on nodes 0..m_edges (like nx.barabasi_albert_graph);
+    every later node attaches to m_edges distinct earlier nodes, each picked
+    from the repeated-endpoints list, i.e. with probability proportional to
+    degree. Returns (target_offsets, targets) in arrival order: node i
+    attaches to targets[target_offsets[i]:target_offsets[i+1]].
+
+    Instead of appending to the endpoints list node by node, each draw is a
+    random index into the list as it was when that node arrived. Even
+    indices are edge sources (known from the index alone), odd indices are
+    targets of earlier edges and are resolved by following those draws.
+    Nodes are processed in blocks so memory beyond the output stays bounded.
+    """
+    if m_edges < 1 or m_edges >= n_nodes:
+        raise ValueError(f"m_edges must be in [1, n_nodes), got {m_edges}")
+    m = m_edges
+    rng = np.random.default_rng(seed)
+
+    n_edges = m + (n_nodes - m - 1) * m
+    targets = np.zeros(n_edges, dtype=np.int64)  # Star edges (1..m -> 0) are already 0
+    target_offsets = np.empty(n_nodes + 1, dtype=np.int64)
+    target_offsets[0] = 0
+    target_offsets[1:m + 2] = np.arange(m + 1)
+    target_offsets[m + 2:] = m + np.arange(1, n_nodes - m) * m
+
+    start = m + 1
+    while start < n_nodes:
+        stop = min(n_nodes, start + min(start, max_block))
+        first_edge = target_offsets[start]
+        slots = np.arange(first_edge, target_offsets[stop])
+        # Each node draws from the endpoints of all edges added before it
+        limit = 2 * target_offsets[start + (slots - first_edge) // m]
+
+        draws = np.empty(len(slots), dtype=np.int64)
+        redraw = np.ones(len(slots), dtype=bool)
+        while redraw.any():
+            draws[redraw] = (rng.random(redraw.sum()) * limit[redraw]).astype(np.int64)
+            block_targets = _resolve_endpoints(draws, targets, first_edge, m)
+            redraw = _duplicate_slots(block_targets.reshape(-1, m))
+        targets[first_edge:target_offsets[stop]] = block_targets
+        start = stop
+
+    return target_offsets, targets
+
+
+def _edge_sources(edges, m):
+    """Source node of each edge: star edges first, then m edges per node"""
+    return np.where(edges < m, edges + 1, m + 1 + (edges - m) // m)
+
+
+def _resolve_endpoints(draws, targets, first_edge, m):
+    """Turn endpoint-list indices drawn for one block into node ids"""
+    edges = draws >> 1
+    is_source = (draws & 1) == 0
+    values = np.where(is_source, _edge_sources(edges, m), -1)
+
+    # Targets of edges before the block are final already
+    earlier = ~is_source & (edges < first_edge)
+    values[earlier] = targets[edges[earlier]]
+
+    # Targets drawn inside the block point to strictly earlier slots,
+    # so repeatedly copying resolved values terminates
+    pending = np.flatnonzero(~is_source & (edges >= first_edge))
+    pointers = edges[pending] - first_edge
+    while len(pending):
+        copied = values[pointers]
+        done = copied >= 0
+        values[pending[done]] = copied[done]
+        pending = pending[~done]
+        pointers = pointers[~done]
+    return values
+
+
+def _duplicate_slots(rows):
+    """Mask of slots repeating an earlier target of the same node"""
+    order = np.argsort(rows, axis=1, kind='stable')
+    sorted_rows = np.take_along_axis(rows, order, axis=1)
+    repeated = sorted_rows[:, 1:] == sorted_rows[:, :-1]
+    mask = np.zeros(rows.shape, dtype=bool)
+    row_ids = np.nonzero(repeated)[0]
+    mask[row_ids, order[:, 1:][repeated]] = True
+    return mask.ravel()
+
+
+def stream_barabasi_albert(m_edges, n_nodes=None, seed=None, layout=None):
+    """
+    Yield GrowthEvents of a Barabási-Albert growth run as it happens.
+
+    Nodes are generated one at a time (endlessly if n_nodes is None), so a
+    scene can consume the run directly without a data file. Each node is
+    placed by an IncrementalLayout, by default inside the [-5, 5] x [-3, 3]
+    data range with its spacing fitted to n_nodes.
+
+    The event list is not materialised, but memory still grows with the run:
+    sampling keeps two endpoints per edge (O(n_nodes * m_edges)) and the
+    layout keeps every node's position.
+    """
+    # Independent streams for the attachment targets and the layout
+    target_seed, layout_seed = np.random.SeedSequence(seed).spawn(2)
+    rng = np.random.default_rng(target_seed)
+    if layout is None:
+        layout = IncrementalLayout(bounds=((-5, -3), (5, 3)), seed=layout_seed, expected_nodes=n_nodes)
+    endpoints = []  # Every edge contributes both ends: sampling is degree-proportional
+    node_id = 0
+    while n_nodes is None or node_id < n_nodes:
+        if node_id == 0:
+            targets = []
+        elif node_id <= m_edges:
+            targets = [0]  # Initial star around node 0
+        else:
+            targets = []
+            while len(targets) < m_edges:
+                target = endpoints[int(rng.random() * len(endpoints))]
+                if target not in targets:
+                    targets.append(target)
+
+        position = layout.add_node(targets)
+        endpoints.extend(targets)
+        endpoints.extend([node_id] * len(targets))
+        yield GrowthEvent(node_id, position, np.array(targets, dtype=np.int64))
+        node_id += 1
+
+
+def growth_events_from_csv(csv_path):
+    """Convert a legacy dense network_data.csv into GrowthEvents"""
+    with open(csv_path, 'r') as f:
+        rows = list(csv.DictReader(f))
+
+    # Targets are stored as coordinates; resolve them back to node ids
+    node_by_position = {(row['x'], row['y']): int(row['node_id']) for row in rows}
+    positions = np.array([[float(row['x']), float(row['y'])] for row in rows])
+    target_offsets = [0]
+    targets = []
+    for row in rows:
+        i = 0
+        while row.get(f'target_{i}_x'):
+            targets.append(node_by_position[(row[f'target_{i}_x'], row[f'target_{i}_y'])])
+            i += 1
+        target_offsets.append(len(targets))
+    return GrowthEvents(positions, np.array(target_offsets), np.array(targets, dtype=np.int64))
+
+
+if __name__ == '__main__':
+    # Usage: python growth_events.py network_data.csv network_data
+    events = growth_events_from_csv(sys.argv[1])
+    save_growth_events(sys.argv[2], events.positions, events.target_offsets, events.targets)
+    print(f"Converted {len(events)} nodes to {sys.argv[2]}")
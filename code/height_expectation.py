@@ -2,6 +2,10 @@ from manim import *
 import numpy as np
 import pandas as pd
 from scipy.interpolate import interp1d
+from label_cache import label, prewarm_labels
+from stream_export import SingleStream
+from render_cache import DataAwareCache
+from fast_mobjects import BatchedDots, InPlaceAnimation, MorphPoints, circle_points, corner_points
 
 def cm_to_imperial(cm):
     """Convert cm to feet and inches"""
@@ -14,45 +18,277 @@ def height_to_x(h):
     """Map height (110-230cm) to x-position (1-12)"""
     return 1 + (h - 110) / (230 - 110) * (12 - 1)
 
-def create_distribution_curve(heights):
+# Heights are counted in 2cm bins across the full 110-230cm range and the
+# curve is sampled at 300 points over the same range
+HEIGHT_BINS = np.arange(110, 232, 2)
+CURVE_SAMPLES = 300
+
+
+def count_to_y(count):
+    """Map a count (0-20 people) to y-position (2-9)"""
+    return 2 + (count / 20) * (8 - 1)
+
+
+class DistributionCurve:
     """
-    Create a smoothed histogram curve from heights data.
-    Returns a VMobject curve.
+    Running histogram of heights and its smoothed curve.
+    
+    smoothing='cubic' interpolates the 2cm bin counts with a cubic spline.
+    Cubic interpolation is linear in the bin counts, so the interpolant is
+    precomputed once as an operator matrix (samples x bins). Adding a height
+    is O(1) and each curve is one matrix-vector product instead of a fresh
+    histogram and spline fit over all heights so far.
+    
+    smoothing='kde' is a binned Gaussian kernel density estimate: heights
+    are linearly binned onto the curve's sample grid and convolved with the
+    kernel by FFT, O(n + m log m) for n heights and m samples. It does not
+    oscillate on sparse data. The bandwidth is in cm; None picks it from the
+    data (Silverman's rule). Densities are scaled to people per 2cm bin so
+    both modes share the count axis.
     """
-    if len(heights) == 0:
-        # Return empty line if no data
-        return Line(start=np.array([1, 1, 0]), end=np.array([12, 1, 0]), stroke_color=WHITE, stroke_width=2)
-    
-    # Create histogram with 2cm bins (across full 110-230cm range)
-    bins = np.arange(110, 232, 2)
-    hist_counts, bin_edges = np.histogram(heights, bins=bins)
-    bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
-    
-    # Create smooth interpolation of histogram
-    if len(bin_centers) > 1:
-        smooth_func = interp1d(bin_centers, hist_counts, kind='cubic', fill_value='extrapolate')
-        
-        # Sample smooth function across full range
-        x_range = np.linspace(110, 230, 300)
-        smooth_counts = np.clip(smooth_func(x_range), 0, None)  # Ensure non-negative
-    else:
-        smooth_counts = np.zeros(300)
-        x_range = np.linspace(110, 230, 300)
-    
-    # Convert to world coordinates (map counts to y-axis 2-9 range, representing 0-20 people)
-    curve_points = []
-    for h, count in zip(x_range, smooth_counts):
-        x_pos = height_to_x(h)
-        y_pos = 2 + (count / 20) * (8 - 1)  # Scale count (0-20) to y-position (2-9)
-        curve_points.append([x_pos, y_pos, 0])
-    
-    # Create curve
-    curve = VMobject(stroke_color="#E79E16", stroke_width=6)
-    curve.set_points_as_corners(np.array(curve_points))
-    
-    return curve
+    
+    def __init__(self, bins=HEIGHT_BINS, samples=CURVE_SAMPLES, smoothing='cubic', bandwidth=None):
+        if smoothing not in ('cubic', 'kde'):
+            raise ValueError(f"Unknown smoothing {smoothing!r}, expected 'cubic' or 'kde'")
+        self.bins = np.asarray(bins, dtype=float)
+        self.smoothing = smoothing
+        self.bandwidth = bandwidth
+        self.n_samples = 0  # All heights added, including those outside the bins
+        self.x_range = np.linspace(self.bins[0], self.bins[-1], samples)
+        self.x_positions = height_to_x(self.x_range)
+        if smoothing == 'cubic':
+            # Counts per bin
+            self.counts = np.zeros(len(self.bins) - 1)
+            bin_centers = (self.bins[:-1] + self.bins[1:]) / 2
+            # Column j is the interpolant of a histogram with a single count in bin j
+            self.operator = interp1d(bin_centers, np.eye(len(bin_centers)), kind='cubic',
+                                     axis=0, fill_value='extrapolate')(self.x_range)
+        else:
+            # Linearly binned weights at each x_range sample
+            self.counts = np.zeros(samples)
+            self.grid_step = self.x_range[1] - self.x_range[0]
+            self.fft_size = 1 << int(np.ceil(np.log2(2 * samples)))  # Zero-padded: no wrap-around
+    
+    def bin_index(self, heights):
+        """Bin of each height as np.histogram assigns it, -1 outside the bins"""
+        heights = np.asarray(heights, dtype=float)
+        index = np.searchsorted(self.bins, heights, side='right') - 1
+        index[heights == self.bins[-1]] = len(self.bins) - 2  # Last bin includes its right edge
+        index[(heights < self.bins[0]) | (heights > self.bins[-1])] = -1
+        return index
+    
+    def _weights(self, heights):
+        """
+        (height index, count slot, weight) triples the given heights
+        contribute to self.counts
+        """
+        heights = np.asarray(heights, dtype=float)
+        if self.smoothing == 'cubic':
+            index = self.bin_index(heights)
+            rows = np.flatnonzero(index >= 0)
+            return rows, index[rows], np.ones(len(rows))
+        rows = np.flatnonzero((heights >= self.x_range[0]) & (heights <= self.x_range[-1]))
+        position = (heights[rows] - self.x_range[0]) / self.grid_step
+        left = np.minimum(position.astype(np.int64), len(self.x_range) - 2)
+        right_share = position - left
+        return (np.concatenate([rows, rows]), np.concatenate([left, left + 1]),
+                np.concatenate([1 - right_share, right_share]))
+    
+    def add(self, heights):
+        """Count one or more new heights"""
+        heights = np.atleast_1d(heights)
+        _, slots, weights = self._weights(heights)
+        self.counts += np.bincount(slots, weights, minlength=len(self.counts))
+        self.n_samples += heights.size
+        return self
+    
+    def smooth_counts(self, counts=None):
+        """
+        Smoothed counts at x_range for the given (or current) counts;
+        counts may be a stack of count vectors, one curve per row
+        """
+        counts = self.counts if counts is None else counts
+        if self.smoothing == 'cubic':
+            return np.clip(counts @ self.operator.T, 0, None)  # Ensure non-negative
+        
+        bandwidth = self.bandwidth
+        if bandwidth is None:
+            bandwidth = self.silverman_bandwidth(counts)[..., None]
+        # Kernel at grid offsets 0, 1, ..., -1 (wrap-around layout), normalized to sum 1
+        offsets = np.fft.fftfreq(self.fft_size, 1 / self.fft_size) * self.grid_step
+        kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+        kernel /= kernel.sum(axis=-1, keepdims=True)
+        density = np.fft.irfft(np.fft.rfft(counts, self.fft_size) * np.fft.rfft(kernel),
+                               self.fft_size)[..., :len(self.x_range)]
+        # Weight per grid step -> people per bin
+        bin_width = self.bins[1] - self.bins[0]
+        return np.clip(density * bin_width / self.grid_step, 0, None)  # Remove FFT round-off
+    
+    def silverman_bandwidth(self, counts=None):
+        """Rule-of-thumb bandwidth 1.06 σ n^(-1/5) from the binned heights"""
+        counts = self.counts if counts is None else counts
+        n = np.maximum(counts.sum(axis=-1), 1)
+        mean = counts @ self.x_range / n
+        variance = np.maximum(counts @ self.x_range ** 2 / n - mean ** 2, 0)
+        # No spread yet (0 or 1 heights): fall back to one bin width
+        bandwidth = np.where(variance > 0, 1.06 * np.sqrt(variance) * n ** -0.2, self.bins[1] - self.bins[0])
+        return np.maximum(bandwidth, self.grid_step)
+    
+    def points(self, counts=None):
+        """Curve points in world coordinates"""
+        y_positions = count_to_y(self.smooth_counts(counts))
+        x_positions = np.broadcast_to(self.x_positions, y_positions.shape)
+        return np.stack([x_positions, y_positions, np.zeros_like(y_positions)], axis=-1)
+    
+    def prefix_points(self, heights):
+        """
+        Curve points after each of the given heights is added to the current
+        counts, for all prefixes in one batched call: (n, samples, 3)
+        """
+        heights = np.atleast_1d(np.asarray(heights, dtype=float))
+        rows, slots, weights = self._weights(heights)
+        # Each height's contribution in its own row, summed up into prefix counts
+        steps = np.zeros((len(heights), len(self.counts)))
+        np.add.at(steps, (rows, slots), weights)
+        return self.points(self.counts + np.cumsum(steps, axis=0))
+    
+    def bezier_points(self, counts=None):
+        """Control points of the curve, always the same number for a given grid"""
+        return corner_points(self.points(counts))
+    
+    def curve(self, counts=None):
+        """Curve VMobject for the given (or current) counts"""
+        curve = VMobject(stroke_color="#E79E16", stroke_width=6)
+        curve.points = self.bezier_points(counts)
+        return curve
+
+
+def smooth_array(t, inflection=10.0):
+    """manim's smooth rate function, vectorized over an array of t"""
+    error = 1 / (1 + np.exp(inflection / 2))
+    return np.clip((1 / (1 + np.exp(-inflection * (t - 0.5))) - error) / (1 - 2 * error), 0, 1)
+
+
+class HeightRain(InPlaceAnimation):
+    """
+    Drops many heights of a HeightExpectation scene as one animation.
+    
+    Dot i is released at i * interval and falls from top to bottom in
+    fall_time, so dots can be in the air together. All released dots live
+    in one batched mobject whose points are rebuilt from an array every
+    frame, and the distribution curve follows the landings on the same
+    timeline from curves precomputed for every prefix of the heights.
+    """
+    
+    def __init__(self, scene, heights, interval=0.075, fall_time=0.5, top=10, bottom=2, **kwargs):
+        self.scene = scene
+        self.heights = np.asarray(heights, dtype=float)
+        self.x_positions = height_to_x(self.heights)
+        self.release_times = np.arange(len(self.heights)) * interval
+        self.fall_time = fall_time
+        self.top = top
+        self.bottom = bottom
+        self.particles = BatchedDots(radius=0.15, stroke_color=WHITE, fill_color=WHITE, fill_opacity=1)
+        if scene.current_curve is None:
+            scene.current_curve = VMobject(stroke_color="#E79E16", stroke_width=6)
+        self.curve = scene.current_curve
+        self.curve_points = scene.distribution.prefix_points(self.heights)
+        self.samples_before = scene.distribution.n_samples
+        self.n_landed = 0
+        run_time = self.release_times[-1] + fall_time if len(self.heights) else 0
+        super().__init__(VGroup(self.particles, self.curve), run_time=run_time, rate_func=linear, **kwargs)
+    
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha) * self.run_time
+        n_released = np.searchsorted(self.release_times, t, side='right')
+        progress = np.clip((t - self.release_times[:n_released]) / self.fall_time, 0, 1)
+        y_positions = self.top + smooth_array(progress) * (self.bottom - self.top)
+        centers = np.stack([self.x_positions[:n_released], y_positions, np.zeros(n_released)], axis=1)
+        self.particles.points = circle_points(centers, self.particles.radius)
+        
+        # Curve only once at least 2 heights have landed
+        n_landed = int(np.count_nonzero(progress >= 1))
+        if n_landed != self.n_landed and self.samples_before + n_landed >= 2:
+            self.curve.points = corner_points(self.curve_points[n_landed - 1])
+        self.n_landed = n_landed
+    
+    def finish(self):
+        super().finish()
+        self.scene.distribution.add(self.heights)
+
 
-class HeightExpectation(MovingCameraScene):
+class HeightExpectation(DataAwareCache, SingleStream, MovingCameraScene):
+    # Curve smoothing: 'cubic' interpolation of the 2cm bins or a binned
+    # 'kde' with the given bandwidth in cm (None: chosen from the data)
+    smoothing = 'cubic'
+    bandwidth = None
+    # Drop the fast dots as one HeightRain instead of one drop_dot each
+    # (no per-dot labels); each dot falls for rain_fall_time
+    particle_stream = False
+    rain_fall_time = 0.5
+    # Axis tick values: heights in cm and numbers of people
+    x_cm_values = [110, 130, 150, 170, 190, 210, 230]
+    y_values = list(range(0, 21, 2))
+    # Render only drop steps [start_step, stop_step), rebuilding the state
+    # before start_step from the data (see parallel_render.py)
+    seekable = True
+    segment_attributes = ('start_step', 'stop_step')
+    start_step = 0
+    stop_step = None
+    label_workers = None  # Processes for pre-warming labels (0: in this process)
+    
+    @classmethod
+    def drop_steps(cls):
+        """
+        (first index, stop index, duration, hold duration) of every drop step.
+        A step drops one dot, or all fast dots in particle-stream mode.
+        """
+        # First 3 dots at 2s each with 0.5s hold
+        steps = [(idx, idx + 1, 2, 0.5) for idx in range(0, 3)]
+        # Accelerating group (3-7) with gradually decreasing duration from 2s to 0.2s, no hold
+        durations = np.linspace(1, 0.075, 4)
+        steps += [(3 + i, 4 + i, duration, 0) for i, duration in enumerate(durations)]
+        # Fast dots from 7 to 73 (stops before 146cm outlier at index 74)
+        if cls.particle_stream:
+            steps.append((7, 74, 0.075, 0))
+        else:
+            steps += [(idx, idx + 1, 0.075, 0) for idx in range(7, 74)]
+        return steps
+    
+    @classmethod
+    def step_durations(cls):
+        """Seconds of every drop step, with the intro and outro waits in the first and last"""
+        durations = []
+        for first, stop, duration, hold_duration in cls.drop_steps():
+            if stop - first > 1:
+                durations.append((stop - first - 1) * duration + cls.rain_fall_time)
+            else:
+                # The curve fade (20% of the duration) starts with the second dot
+                durations.append(hold_duration + duration * (0.8 if first == 0 else 1))
+        durations[0] += 1
+        durations[-1] += 1
+        return np.array(durations)
+    
+    def setup(self):
+        super().setup()
+        # --- LOAD HEIGHT DATA ---
+        df = pd.read_csv('height_synthetic.csv')
+        self.heights = df['Height'].values
+        prewarm_labels(self.label_specs(), max_workers=self.label_workers)
+    
+    def label_specs(self):
+        """(text, font_size, color, font) of every label the scene shows"""
+        specs = [("height", 40), ("number of people", 40)]
+        for cm_val in self.x_cm_values:
+            specs += [(f"{cm_val}cm", 36), (cm_to_imperial(cm_val), 34)]
+        specs += [(f"{y_val}", 36) for y_val in self.y_values]
+        # Only dots dropped one at a time are labelled
+        for first, stop, _, _ in self.drop_steps():
+            if stop - first == 1:
+                height = self.heights[first]
+                specs += [(f"{int(height)}cm", 36), (cm_to_imperial(height), 34)]
+        return [(text, font_size, WHITE, "sans-serif") for text, font_size in specs]
+    
     def drop_dot(self, idx, duration, hold_duration=0):
         """
         Drop a single dot with specified duration.
@@ -68,18 +304,19 @@ class HeightExpectation(MovingCameraScene):
         
         height = self.heights[idx]
         x_pos = height_to_x(height)
+        self.data_prefix.update(height)
         
         # Create dot
         dot = Circle(radius=0.15, color=WHITE, fill_opacity=1)
         dot.move_to([x_pos, 10, 0])
         
         # Create metric label
-        metric_label = Text(f"{int(height)}cm", font_size=36, color=WHITE, font="sans-serif")
+        metric_label = label(f"{int(height)}cm", font_size=36, color=WHITE, font="sans-serif")
         metric_label.move_to([x_pos + 1, 10.7, 0])
         
         # Create imperial label
         imperial = cm_to_imperial(height)
-        imperial_label = Text(imperial, font_size=34, color=WHITE, font="sans-serif")
+        imperial_label = label(imperial, font_size=34, color=WHITE, font="sans-serif")
         imperial_label.move_to([x_pos + 1, 9.9, 0])
         
         # Add and animate dot dropping
@@ -97,23 +334,43 @@ class HeightExpectation(MovingCameraScene):
         )
         
         # Update distribution curve (only if we have at least 2 points)
-        heights_so_far = self.heights[:idx + 1]
-        if len(heights_so_far) >= 2:
-            new_curve = create_distribution_curve(heights_so_far)
-            
-            # Fade old curve to new curve
-            if hasattr(self, 'current_curve') and self.current_curve is not None:
-                self.play(
-                    FadeOut(self.current_curve),
-                    FadeIn(new_curve),
-                    run_time=fade_duration
-                )
-                self.remove(self.current_curve)
+        self.distribution.add(height)
+        if self.distribution.n_samples >= 2:
+            # One persistent curve; later updates morph its points in place
+            if self.current_curve is None:
+                self.current_curve = self.distribution.curve()
+                self.play(FadeIn(self.current_curve), run_time=fade_duration)
             else:
-                self.play(FadeIn(new_curve), run_time=fade_duration)
-            
-            self.add(new_curve)
-            self.current_curve = new_curve
+                self.play(MorphPoints(self.current_curve, self.distribution.bezier_points()),
+                          run_time=fade_duration)
+    
+    def restore_state(self, steps):
+        """
+        Jump to the state after the given drop steps: their dots resting on
+        the axis (their labels have faded out) and the curve for their heights.
+        """
+        heights = []
+        for first, stop, _, _ in steps:
+            if stop - first > 1:
+                self.data_prefix.update(self.heights[first:stop])
+            else:
+                self.data_prefix.update(self.heights[first])
+            heights.extend(self.heights[first:stop])
+        heights = np.array(heights, dtype=float)
+        self.distribution.add(heights)
+        centers = np.stack([height_to_x(heights), np.full(len(heights), 2), np.zeros(len(heights))], axis=1)
+        
+        # As when dropped one by one, the curve appears with the second dot:
+        # the first two dots lie under it, later ones on top
+        below, above = [
+            BatchedDots(radius=0.15, stroke_color=WHITE, fill_color=WHITE, fill_opacity=1).add_dots(part)
+            for part in (centers[:2], centers[2:])
+        ]
+        self.add(below)
+        if self.distribution.n_samples >= 2:
+            self.current_curve = self.distribution.curve()
+            self.add(self.current_curve)
+        self.add(above)
     
     def construct(self):
         # --- CAMERA SETTINGS ---
@@ -131,7 +388,7 @@ class HeightExpectation(MovingCameraScene):
         y_axis = Line(start=origin, end=np.array([1, 9, 0]), stroke_color=WHITE, stroke_width=2)
         
         # X-axis ticks and labels (110-230cm)
-        x_cm_values = [110, 130, 150, 170, 190, 210, 230]
+        x_cm_values = self.x_cm_values
         x_positions = np.linspace(1, 12, len(x_cm_values))
         
         x_ticks = []
@@ -141,20 +398,20 @@ class HeightExpectation(MovingCameraScene):
             tick = Line(start=np.array([pos, 2, 0]), end=np.array([pos, 1.85, 0]), stroke_color=WHITE, stroke_width=1.5)
             x_ticks.append(tick)
             
-            metric_label = Text(f"{cm_val}cm", font_size=36, color=WHITE, font="sans-serif")
+            metric_label = label(f"{cm_val}cm", font_size=36, color=WHITE, font="sans-serif")
             metric_label.move_to([pos, 1.3, 0])
             x_labels.append(metric_label)
             
             imperial = cm_to_imperial(cm_val)
-            imperial_label = Text(imperial, font_size=34, color=WHITE, font="sans-serif")
+            imperial_label = label(imperial, font_size=34, color=WHITE, font="sans-serif")
             imperial_label.move_to([pos, 0.85, 0])
             x_labels.append(imperial_label)
         
-        x_title = Text("height", font_size=40, color=WHITE, font="sans-serif")
+        x_title = label("height", font_size=40, color=WHITE, font="sans-serif")
         x_title.move_to([6.5, -0.3, 0])
         
         # Y-axis ticks and labels (0-20)
-        y_values = list(range(0, 21, 2))
+        y_values = self.y_values
         y_positions = np.linspace(2, 9, len(y_values))
         
         y_ticks = []
@@ -164,11 +421,11 @@ class HeightExpectation(MovingCameraScene):
             tick = Line(start=np.array([1, pos, 0]), end=np.array([0.85, pos, 0]), stroke_color=WHITE, stroke_width=1.5)
             y_ticks.append(tick)
             
-            label = Text(f"{y_val}", font_size=36, color=WHITE, font="sans-serif")
-            label.move_to([0.55, pos, 0])
-            y_labels.append(label)
+            y_label = label(f"{y_val}", font_size=36, color=WHITE, font="sans-serif")
+            y_label.move_to([0.55, pos, 0])
+            y_labels.append(y_label)
         
-        y_title = Text("number of people", font_size=40, color=WHITE, font="sans-serif")
+        y_title = label("number of people", font_size=40, color=WHITE, font="sans-serif")
         y_title.rotate(PI / 2)
         y_title.move_to([-0.5, 5.5, 0])
         
@@ -177,27 +434,24 @@ class HeightExpectation(MovingCameraScene):
         self.add(*x_ticks, *x_labels, x_title)
         self.add(*y_ticks, *y_labels, y_title)
         
-        self.wait(1)
+        if not self.start_step:
+            self.wait(1)
         
-        # --- LOAD HEIGHT DATA ---
-        df = pd.read_csv('height_synthetic.csv')
-        self.heights = df['Height'].values
+        # --- DISTRIBUTION STATE ---
         self.current_curve = None
+        self.distribution = DistributionCurve(smoothing=self.smoothing, bandwidth=self.bandwidth)  # Running counts of the dropped heights
         
         # --- DROP DOTS WITH EXPLICIT TIMING ---
-        # First 3 dots at 2s each with 0.5s hold
-        for idx in range(0, 3):
-            self.drop_dot(idx, 2, hold_duration=0.5)
-        
-        # Accelerating group (3-7) with gradually decreasing duration from 2s to 0.2s, no hold
-        durations = np.linspace(1, 0.075, 4)
-        for i, duration in enumerate(durations):
-            self.drop_dot(3 + i, duration, hold_duration=0)
-        
-        # Fast dots from 7 to 73 (stops before 146cm outlier at index 74)
-        for idx in range(7, 74):
-            self.drop_dot(idx, 0.075, hold_duration=0)
+        steps = self.drop_steps()
+        if self.start_step:
+            self.restore_state(steps[:self.start_step])
+        for first, stop, duration, hold_duration in steps[self.start_step:self.stop_step]:
+            if stop - first > 1:
+                self.data_prefix.update(self.heights[first:stop])
+                self.play(HeightRain(self, self.heights[first:stop], interval=duration,
+                                     fall_time=self.rain_fall_time))
+            else:
+                self.drop_dot(first, duration, hold_duration=hold_duration)
         
-        self.wait(1)
-
-
+        if self.stop_step is None or self.stop_step >= len(steps):
+            self.wait(1)
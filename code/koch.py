@@ -1,21 +1,88 @@
 from manim import *
 import numpy as np
+from fast_mobjects import MorphPoints, corner_points, pixel_size, simplify_mask
+
+
+def koch_subdivide(points, bump_scale=1):
+    """
+    One Koch step for a closed polygon: every edge p1 -> p2 of the (N, 3)
+    vertex array becomes p1, a, peak, b. Returns the (4N, 3) vertices.
+    With bump_scale=0 the peak stays on the edge: the same shape, sampled
+    at the next level's vertex layout.
+    """
+    p1 = points
+    v = np.roll(points, -1, axis=0) - p1
+    # Outward normal times the bump height |v| / 3 * sqrt(3) / 2
+    bump = np.stack([v[:, 1], -v[:, 0], np.zeros(len(v))], axis=1) * (bump_scale * np.sqrt(3) / 6)
+    new_points = np.empty((len(points), 4, 3))
+    new_points[:, 0] = p1
+    new_points[:, 1] = p1 + v / 3
+    new_points[:, 2] = p1 + v / 2 + bump
+    new_points[:, 3] = p1 + 2 * v / 3
+    return new_points.reshape(-1, 3)
+
+
+class KochLevels:
+    """
+    Vertices of every Koch level of a closed polygon, computed on demand.
+    Level d is subdivided from level d - 1 and all levels are kept.
+
+    aligned(d) is level d sampled at the vertex layout of level d + 1, with
+    collinear points where the bumps will grow, so a morph from level d to
+    d + 1 is a plain interpolation between arrays of equal length.
+    """
+
+    def __init__(self, points):
+        self.levels = [np.asarray(points, dtype=float)]
+        self.aligned_levels = {}
+
+    def __getitem__(self, depth):
+        while len(self.levels) <= depth:
+            self.levels.append(koch_subdivide(self.levels[-1]))
+        return self.levels[depth]
+
+    def aligned(self, depth):
+        if depth not in self.aligned_levels:
+            self.aligned_levels[depth] = koch_subdivide(self[depth], bump_scale=0)
+        return self.aligned_levels[depth]
+
+    def outline(self, depth, aligned=False):
+        """Vertices of level depth as a closed path (first vertex repeated)"""
+        points = self.aligned(depth) if aligned else self[depth]
+        return np.concatenate([points, points[:1]])
+
 
 class Koch(Scene):
+    # KochLevels keeps deep levels cheap (depth 8 has 196,608 vertices), and
+    # levels with sub-pixel segments are simplified before drawing
+    max_depth = 5
+
     def construct(self):
         side_length = 10
-        max_depth = 5
+        max_depth = self.max_depth
         linewidth = 3
 
         snowflakes = []
         colored_snowflakes = []
+        levels = KochLevels(self.initial_triangle(side_length))
+        # Once a level's segments are shorter than one output pixel, only the
+        # vertices visible at that resolution are kept; level d shares its mask
+        # with the aligned level d - 1 it morphs from, so point counts still
+        # match. Coarser levels are drawn in full.
+        tolerance = pixel_size(config.frame_width, config.pixel_width)
+        keep = []
         for depth in range(max_depth + 1):
-            triangle = self.initial_triangle(side_length)
-            points = self.koch_recursive(triangle, depth)
+            closed = levels.outline(depth)
+            if side_length / 3 ** depth < tolerance:
+                keep.append(simplify_mask(closed, tolerance)
+                            | simplify_mask(levels.outline(depth - 1, aligned=True), tolerance))
+            else:
+                keep.append(np.ones(len(closed), dtype=bool))
+            closed = closed[keep[depth]]
             shape = VMobject(stroke_color="#AFCBCF", stroke_width=linewidth)
             colored_shape = VMobject(stroke_color="#E79E16", stroke_width=linewidth)
-            shape.set_points_as_corners(points + [points[0]])
-            colored_shape.set_points_as_corners(points + [points[0]])
+            shape.set_points_as_corners(closed)
+            colored_shape.set_points_as_corners(closed)
             snowflakes.append(shape)
             colored_snowflakes.append(colored_shape)
 
@@ -32,11 +99,15 @@ class Koch(Scene):
             current = white
             self.wait(0.5)
 
-            # A: Overlay current white with next colored
+            # A: Overlay current white with next colored, growing its bumps
+            # out of the current level (same point count, no realignment)
             if i + 1 < len(snowflakes):
                 colored = colored_snowflakes[i + 1]
-                overlaid = VGroup(colored, current.copy())
-                self.play(Transform(current, overlaid))
+                next_points = colored.points
+                colored.points = corner_points(levels.outline(i, aligned=True)[keep[i + 1]])
+                self.add(colored, current)  # White stays on top
+                self.play(MorphPoints(colored, next_points))
+                current = VGroup(colored, current)
                 self.wait(0.2)
 
         self.wait(2)
@@ -50,27 +121,4 @@ class Koch(Scene):
         return [p1, p2, p3]
 
     def koch_recursive(self, points, depth):
-        if depth == 0:
-            return points
-        new_points = []
-        for i in range(len(points)):
-            p1 = points[i]
-            p2 = points[(i + 1) % len(points)]
-            new_points += self.add_bump(p1, p2)
-        return self.koch_recursive(new_points, depth - 1)
-
-    def add_bump(self, p1, p2):
-        v = p2 - p1
-        a = p1 + v / 3
-        b = p1 + 2 * v / 3
-        m = (a + b) / 2
-
-        dir = b - a
-        dir /= np.linalg.norm(dir)
-        normal = -np.array([-dir[1], dir[0], 0])
-
-        s = np.linalg.norm(b - a)
-        height = s * np.sqrt(3) / 2
-        peak = m + normal * height
-
-        return [p1, a, peak, b]
+        return KochLevels(points)[depth]
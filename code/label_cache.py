@@ -0,0 +1,75 @@
+from manim import *
+import hashlib
+import tempfile
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import manim
+
+# Rendered Text labels by (string, font, font size, color); label() hands
+# out copies so scenes can move and fade them freely
+_labels = {}
+
+
+def _key(text, font_size, color, font):
+    return (text, font, font_size, ManimColor(color).to_hex())
+
+
+def label(text, font_size=DEFAULT_FONT_SIZE, color=WHITE, font=""):
+    """Text(text, ...) built once per distinct label, returned as a copy"""
+    key = _key(text, font_size, color, font)
+    if key not in _labels:
+        _labels[key] = Text(text, font_size=font_size, color=color, font=font)
+    return _labels[key].copy()
+
+
+def _marker_path(key):
+    """
+    File marking a label's SVG as written into manim's text cache by an
+    earlier run. Markers live in the system temp directory, not in the
+    (committed) media folder, and are keyed on the text cache directory, our
+    label key and the manim version; a stale or missing marker only means
+    the label's SVG is written in process instead of in the pool.
+    """
+    text_dir = str(config.get_dir("text_dir").resolve())
+    digest = hashlib.sha256(repr((manim.__version__, text_dir) + key).encode()).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / "heavy_tails_labels" / digest
+
+
+def _render_label(spec, text_dir):
+    # Runs in a worker: building the Text writes its SVG to the shared text
+    # cache; the Text itself is discarded
+    config.text_dir = text_dir
+    text, font_size, color, font = spec
+    Text(text, font_size=font_size, color=color, font=font)
+
+
+def prewarm_labels(specs, max_workers=None):
+    """
+    Pre-warm manim's SVG text cache (media/texts) for every label a scene
+    will need before construct runs.
+
+    specs are (text, font_size[, color[, font]]) tuples as passed to label().
+    Labels whose SVG no earlier run has written are rendered to SVG in
+    parallel worker processes, or in this process if only one is missing or
+    max_workers is 0. Only the SVG files are shared: the Text mobjects are
+    then built here one after another, each loading its cached SVG.
+    """
+    missing = {}
+    for spec in specs:
+        text, font_size, color, font = tuple(spec) + (WHITE, "")[len(spec) - 2:]
+        key = _key(text, font_size, color, font)
+        if key not in _labels:
+            missing[key] = (text, font_size, color, font)
+    if not missing:
+        return
+    uncached = [spec for key, spec in missing.items() if not _marker_path(key).exists()]
+    if len(uncached) > 1 and max_workers != 0:
+        text_dir = str(config.get_dir("text_dir"))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(_render_label, uncached, [text_dir] * len(uncached)))
+    for text, font_size, color, font in missing.values():
+        label(text, font_size, color, font)
+    for key in missing:
+        marker = _marker_path(key)
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
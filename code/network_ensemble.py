@@ -0,0 +1,73 @@
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from growth_events import barabasi_albert_targets
+from network_stats import binned_degree_counts
+
+# Mean node count per degree bin over many realizations, with its standard error
+DegreeEnsemble = namedtuple('DegreeEnsemble', ['edges', 'mean', 'stderr', 'n_realizations'])
+
+# Set in each worker by _init_worker
+_worker = {}
+
+
+def _init_worker(shm_name, shape, n_nodes, m_edges, edges):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker.update(shm=shm, counts=np.ndarray(shape, dtype=np.int64, buffer=shm.buf),
+                   n_nodes=n_nodes, m_edges=m_edges, edges=edges)
+
+
+def _run_realization(row, seed):
+    """Grow one network and write its binned degree counts into row `row`"""
+    target_offsets, targets = barabasi_albert_targets(_worker['n_nodes'], _worker['m_edges'], seed=seed)
+    degrees = np.bincount(targets, minlength=_worker['n_nodes']) + np.diff(target_offsets)
+    _worker['counts'][row] = binned_degree_counts(degrees, _worker['edges'])
+
+
+def run_ensemble(n_realizations, n_nodes, m_edges, edges=None, seed=None, max_workers=None):
+    """
+    Simulate n_realizations independent Barabási-Albert networks in a
+    process pool and average their degree histograms.
+
+    Every realization gets its own seed spawned from one SeedSequence(seed),
+    so the ensemble is reproducible and does not depend on the number of
+    workers. Workers write their counts straight into one shared-memory
+    (n_realizations x n_bins) array instead of sending them back pickled.
+    edges are degree bin edges as in network_stats.degree_bins; by default
+    one bin per degree 1..n_nodes - 1.
+    """
+    if edges is None:
+        edges = np.arange(1, n_nodes + 1)
+    edges = np.asarray(edges)
+    shape = (n_realizations, len(edges) - 1)
+    seeds = np.random.SeedSequence(seed).spawn(n_realizations)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * 8, 1))
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(shm.name, shape, n_nodes, m_edges, edges)) as pool:
+            # Consume the results to surface worker errors
+            list(pool.map(_run_realization, range(n_realizations), seeds,
+                          chunksize=max(1, n_realizations // 64)))
+        counts = np.ndarray(shape, dtype=np.int64, buffer=shm.buf).astype(float)
+    finally:
+        shm.close()
+        shm.unlink()
+
+    mean = counts.mean(axis=0)
+    stderr = counts.std(axis=0, ddof=1) / np.sqrt(n_realizations) if n_realizations > 1 else np.zeros_like(mean)
+    return DegreeEnsemble(edges, mean, stderr, n_realizations)
+
+
+if __name__ == '__main__':
+    # Usage: python network_ensemble.py [n_realizations] [n_nodes] [m_edges]
+    n_realizations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    n_nodes = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    m_edges = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+    ensemble = run_ensemble(n_realizations, n_nodes, m_edges, seed=1)
+    print(f"{n_realizations} realizations of {n_nodes} nodes, m = {m_edges}")
+    for degree, mean, stderr in zip(ensemble.edges, ensemble.mean, ensemble.stderr):
+        if mean > 0:
+            print(f"degree {degree}: {mean:.3f} ± {stderr:.3f}")
@@ -1,186 +1,424 @@
 from manim import *
 import numpy as np
-import csv
+from itertools import islice
+from network_stats import DegreeStats, degree_bins, peak_binned_degree_counts
+from growth_events import load_growth_events, stream_barabasi_albert
+from fast_mobjects import BatchedLines, InPlaceAnimation, OutlinedDots, segment_points
+from animated_histogram import AnimatedHistogram, AxisScale
+from label_cache import label, prewarm_labels
+from stream_export import SingleStream
+from render_cache import DataAwareCache
+from network_ensemble import run_ensemble
 
-class NetworkGrowth(MovingCameraScene):
+class GrowthSequence(InPlaceAnimation):
+    """
+    Plays many node arrivals of a NetworkGrowth scene as one animation.
+    
+    Every node gets an equal slot of the timeline, split like the separate
+    fast-phase play calls in the proportions of the scene's
+    fast_node_timings: dot fade-in, connections growing, histogram update
+    and hold. State is only built when a slot is reached.
+    """
+    
+    def __init__(self, scene, events, node_run_time=7/15, **kwargs):
+        self.scene = scene
+        self.events = list(events)
+        self.arrivals = VGroup()  # The current orange dot and connections
+        self.n_started = 0
+        self.current = None  # (dot, connections, ends, old_counts, new_counts)
+        # Start and end of each phase of a slot, as fractions of the slot
+        timings = np.asarray(scene.fast_node_timings, dtype=float)
+        self.phase_ends = np.cumsum(timings) / timings.sum()
+        self.phase_starts = np.concatenate([[0], self.phase_ends[:-1]])
+        group = Group(scene.settled_edges, scene.settled_dots, scene.histogram, self.arrivals)
+        super().__init__(group, run_time=len(self.events) * node_run_time, rate_func=linear, **kwargs)
+    
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha) * len(self.events)
+        node = min(int(t), len(self.events) - 1)
+        while self.n_started <= node:
+            self.start_node(self.events[self.n_started])
+            self.n_started += 1
+        self.show_progress(min(t - node, 1))
+    
+    def finish(self):
+        super().finish()
+        self.scene.histogram.set_counts(self.current[4])
+    
+    def start_node(self, event):
+        if self.current is None:
+            # Elements left over from earlier play calls live in the scene
+            self.scene.settle_current_elements()
+        else:
+            self.show_progress(1)
+            self.scene.histogram.set_counts(self.current[4])
+            self.scene.settle_current_elements(container=self.arrivals)
+        dot, connections = self.scene.create_node_elements(event)
+        ends = [line.get_end() for line in connections]
+        self.arrivals.add(*connections, dot)
+        old_counts = self.scene.histogram_counts()
+        self.scene.degree_stats.add_node(event.node_id, event.targets)
+        self.current = (dot, connections, ends, old_counts, self.scene.histogram_counts())
+    
+    def show_progress(self, fraction):
+        """Draw the current node's slot at the given fraction (0-1)"""
+        dot, connections, ends, old_counts, new_counts = self.current
+        # Zero-length phases jump straight to their end state
+        lengths = np.maximum(self.phase_ends - self.phase_starts, 1e-9)
+        dot_alpha, line_alpha, histogram_alpha = (
+            smooth(alpha) for alpha in np.clip((fraction - self.phase_starts) / lengths, 0, 1)[:3])
+        
+        dot.set_fill(opacity=dot_alpha).set_stroke(opacity=dot_alpha)
+        start = dot.get_center()
+        for line, end in zip(connections, ends):
+            line.points = segment_points(start, start + line_alpha * (end - start))
+        self.scene.histogram.show_between(old_counts, new_counts, histogram_alpha)
+
+
+class NetworkGrowth(DataAwareCache, SingleStream, MovingCameraScene):
+    # Merge settled (white) dots and edges into a few batched mobjects so per-frame
+    # cost stays flat as the network grows; only the orange node is separate
+    batch_settled = True
+    # Nodes after the first slow_nodes are played as GrowthSequences of up to
+    # fast_phase_chunk nodes each instead of three play calls per node
+    slow_nodes = 5
+    # Seconds of dot fade-in, connections, histogram update and hold per node
+    slow_node_timings = (15/15, 10/15, 10/15, 5/15)
+    fast_node_timings = (3/15, 2/15, 2/15, 0)
+    coalesce_fast_phase = True
+    fast_phase_chunk = 200
+    # Histogram axes: 'linear', 'log' or 'auto' (log once degrees exceed
+    # max_linear_degree). Ranges come from the data when it is known up front
+    histogram_scale = 'auto'
+    max_linear_degree = 50
+    default_max_degree = 25
+    default_max_count = 35
+    # Begin with this many nodes already settled, restored from the data
+    # through a DegreeIndex instead of replayed (needs a GrowthEvents source),
+    # and stop before node stop_node without the final curve (None: play to
+    # the end). Used to render segments in parallel, see parallel_render.py
+    seekable = True
+    segment_attributes = ('start_node', 'stop_node')
+    start_node = 0
+    stop_node = None
+    label_workers = None  # Processes for pre-warming labels (0: in this process)
+    # Draw the final curve as the mean over this many independent runs of
+    # the same size (with standard-error bars) instead of this run's counts
+    ensemble_size = 0
+    ensemble_seed = 1
+    m_edges = 2  # Edges per new node, as in generate_network.py
+    # Growth run written by generate_network.py, read by growth_events() and step_durations()
+    data_path = 'network_data'
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.network_data = []
+        self.node_positions = []  # Manim position of every node added so far
+        self.degree_stats = DegreeStats()
         self.dots = []  # Keep track of all dots added
-        self.histogram_bars = {}  # {degree: bar_object}
+        self.histogram = None  # AnimatedHistogram, one bar per degree bin
+        self.bin_edges = None  # Degree bin edges, see network_stats.degree_bins
+        self.degree_axis = None  # AxisScale for degrees (x)
+        self.count_axis = None  # AxisScale for node counts (y)
         self.orange = "#E79E16"
         self.current_orange_elements = []  # Track current orange dot and connections
+        # Outlines under all fills, so overlapping settled dots don't show rings
+        self.settled_dots = OutlinedDots(radius=0.15, stroke_color=BLACK, stroke_width=2,
+                                         fill_color=WHITE, fill_opacity=1)
+        self.settled_edges = BatchedLines(stroke_color=WHITE, stroke_width=4)
+        self.settled_edges.set_z_index(-1)
     
-    def load_network_data(self):
-        """Load network data from CSV file"""
-        with open('network_data.csv', 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                self.network_data.append(row)
+    def setup(self):
+        super().setup()
+        self.events = self.growth_events()
+        self.setup_histogram_axes(self.events)
+        prewarm_labels(self.label_specs(), max_workers=self.label_workers)
     
-    def init_histogram(self):
-        """Initialize all 25 histogram bars with height 0"""
-        for degree in range(1, 26):  # Degrees 1-25
-            # Map degree (0-25) to right-side x-axis (10.25-15.25 in manim coords)
-            x_pos = 10.25 + (degree / 25.0) * 5.0
-            # Bar width of 1 unit on the right-side axis = 0.2 in manim coordinates
-            bar_width = (1.0 / 25.0) * 5.0  # = 0.2
-            bar_height = 0  # Start at height 0
-            y_pos = 0.5 + bar_height / 2
-            
-            bar = Rectangle(width=bar_width, height=bar_height, 
-                           fill_color=WHITE, fill_opacity=1, stroke_width=0)
-            bar.move_to([x_pos, y_pos, 0])
-            self.histogram_bars[degree] = bar
-            self.add(bar)
+    def render_inputs(self):
+        """Histogram bins and axis ranges: derived from all the data, shown in every frame"""
+        return [self.bin_edges, self.degree_axis.max_value, self.degree_axis.log,
+                self.count_axis.max_value, self.count_axis.log]
     
-    def update_histogram(self, node_index, histogram_duration=15/15):
-        """Update histogram based on degree data from current node"""
-        from collections import Counter
-        
-        node_data = self.network_data[node_index]
-        
-        # Get degree values for all added nodes (indices 0 to node_index)
-        degrees = []
-        for i in range(node_index + 1):
-            degree_key = f'degree_at_node_{i}'
-            if degree_key in node_data:
-                degree = int(float(node_data[degree_key]))
-                if degree > 0:  # Only count non-zero degrees
-                    degrees.append(degree)
-        
-        # Count frequency of each degree
-        degree_counts = Counter(degrees)
-        
-        # Create replacement transform animations for all bars
-        replacement_animations = []
-        bars_to_update = []
-        
-        for degree in range(1, 26):  # Degrees 1-25
-            count = degree_counts.get(degree, 0)
-            
-            # Map degree (0-25) to right-side x-axis (10.25-15.25 in manim coords)
-            x_pos = 10.25 + (degree / 25.0) * 5.0
-            # Bar width of 1 unit on the right-side axis = 0.2 in manim coordinates
-            bar_width = (1.0 / 25.0) * 5.0  # = 0.2
-            bar_height = count * (7.0 / 35.0)  # Scale count (0-35) to axis span of 7.0
-            y_pos = 0.5 + bar_height / 2
-            
-            old_bar = self.histogram_bars[degree]
-            new_bar = Rectangle(width=bar_width, height=bar_height,
-                               fill_color=WHITE, fill_opacity=1, stroke_width=0)
-            new_bar.move_to([x_pos, y_pos, 0])
-            
-            replacement_animations.append(ReplacementTransform(old_bar, new_bar, run_time=histogram_duration))
-            bars_to_update.append((degree, new_bar))
-        
-        # Play all bar updates simultaneously
-        if replacement_animations:
-            self.play(*replacement_animations)
+    def label_specs(self):
+        """(text, font_size, color, font) of every label the scene shows"""
+        specs = [("number of connections", 32), ("count", 32)]
+        specs += [(f"{int(val)}", 28) for val in self.degree_axis.ticks()[0]]
+        specs += [(f"{int(val)}", 28) for val in self.count_axis.ticks()[0]]
+        return [(text, font_size, WHITE, "sans-serif") for text, font_size in specs]
+    
+    @classmethod
+    def node_durations(cls, n_targets):
+        """Seconds of every node's arrival, given each node's number of targets"""
+        n_targets = np.asarray(n_targets)
+        slow = np.arange(len(n_targets)) < cls.slow_nodes
+        dot, connection, histogram, wait = np.where(slow, np.array(cls.slow_node_timings)[:, None],
+                                                    np.array(cls.fast_node_timings)[:, None])
+        # Coalesced nodes get equal slots; separate ones skip the connection play without targets
+        has_connections = (n_targets > 0) | (~slow & cls.coalesce_fast_phase)
+        durations = dot + connection * has_connections + histogram + wait
+        if len(durations):
+            durations[-1] += 15/15 + 2  # Final curve and hold
+        return durations
+    
+    @classmethod
+    def step_durations(cls):
+        """Seconds of every node's arrival, with the outro in the last"""
+        return cls.node_durations(np.diff(load_growth_events(cls.data_path).target_offsets))
+    
+    def growth_events(self):
+        """
+        Iterable of GrowthEvents driving the scene.
+        Defaults to the memory-mapped run at data_path;
+        subclasses can return any other (lazy) event source.
+        """
+        return load_growth_events(self.data_path)
+    
+    def data_to_manim(self, xy):
+        """Map data coordinates ([-5, 5] x [-3, 3]) to manim coordinates"""
+        xy = np.asarray(xy, dtype=float)
+        # Normalize from original range [-5, 5] for x and [-3, 3] for y to [0, 2]
+        x_normalized = ((xy[..., 0] + 5) / 10) * 2
+        y_normalized = ((xy[..., 1] + 3) / 6) * 2
         
-        # Update dictionary with new bar objects
-        for degree, new_bar in bars_to_update:
-            self.histogram_bars[degree] = new_bar
+        # Scale to Manim coordinates [0.25, 8.25] for x and [0.5, 8.5] for y
+        x_manim = 0.28 + x_normalized * 4
+        y_manim = -0.25 + y_normalized * 4
+        return np.stack([x_manim, y_manim, np.zeros_like(x_manim)], axis=-1)
     
-    def add_node(self, node_index):
-        """Create, add to scene, and return a dot for the given node index"""
-        # Flatten previous orange elements to white
-        for element in self.current_orange_elements:
-            element.set_fill(WHITE)
-            # Only set stroke to white for connections (Lines), not dots (Circles)
-            if isinstance(element, Line):
-                element.set_stroke(WHITE)
-        self.current_orange_elements = []
+    def setup_histogram_axes(self, events):
+        """
+        Choose degree bins and axis ranges for the histogram. They are derived
+        from the final degrees when the event source knows them up front
+        (e.g. a loaded GrowthEvents run), otherwise defaults are used.
+        """
+        if hasattr(events, 'degrees'):
+            final_degrees = events.degrees()
+            max_degree = max(final_degrees.max(), 1)
+        else:
+            final_degrees = None
+            max_degree = self.default_max_degree
         
-        # Set animation durations based on node_index
-        if node_index < 5:
-            dot_duration = 15/15
-            connection_duration = 10/15
-            histogram_duration = 10/15
-            histo_wait_duration = 5/15
+        if self.histogram_scale == 'auto':
+            log = max_degree > self.max_linear_degree
         else:
-            dot_duration = 3/15
-            connection_duration = 2/15
-            histogram_duration = 2/15
-            histo_wait_duration = 0
+            log = self.histogram_scale == 'log'
+        self.bin_edges = degree_bins(max_degree, log=log)
         
-        node_data = self.network_data[node_index]
-        x_orig = float(node_data['x'])
-        y_orig = float(node_data['y'])
+        if final_degrees is not None:
+            # Bins can hold more nodes mid-run than at the end: use every step's counts
+            peaks = peak_binned_degree_counts(events.target_offsets, events.targets, self.bin_edges)
+            max_count = max(peaks.max(), 1)
+        else:
+            max_count = self.default_max_count
         
-        # Normalize from original range [-5, 5] for x and [-3, 3] for y to [0, 2]
-        x_normalized = ((x_orig + 5) / 10) * 2  # [-5, 5] -> [0, 1] -> [0, 2]
-        y_normalized = ((y_orig + 3) / 6) * 2   # [-3, 3] -> [0, 1] -> [0, 2]
+        # Map degrees to right-side x-axis (10.25-15.25 in manim coords)
+        # and counts to the y-axis (0.5-7.5)
+        if log:
+            self.degree_axis = AxisScale(10.25, 15.25, max_degree, min_value=1, log=True)
+        else:
+            self.degree_axis = AxisScale(10.25, 15.25, max_degree, integer=True)
+        self.count_axis = AxisScale(0.5, 7.5, max_count, log=log, integer=True)
+    
+    def add_histogram_axes(self):
+        """Add the histogram axes, ticks and tick labels to the scene"""
+        # X-axis (width) and Y-axis (height)
+        hist_x_axis = Line(start=np.array([10.25, 0.5, 0]), end=np.array([15.25, 0.5, 0]), stroke_color=WHITE, stroke_width=2)
+        hist_y_axis = Line(start=np.array([10.25, 0.5, 0]), end=np.array([10.25, 7.5, 0]), stroke_color=WHITE, stroke_width=2)
+        self.add(hist_x_axis, hist_y_axis)
         
-        # Scale to Manim coordinates [0.25, 8.25] for x and [0.5, 8.5] for y
-        x_manim = 0.28 +  x_normalized * 4
-        y_manim = -0.25 + y_normalized * 4
+        x_major, x_minor = self.degree_axis.ticks()
+        y_major, y_minor = self.count_axis.ticks()
+        x_major_pos = self.degree_axis(x_major)
+        y_major_pos = self.count_axis(y_major)
+        
+        # Major ticks, one batched mobject per axis
+        hist_x_ticks = BatchedLines(stroke_color=WHITE, stroke_width=1.5)
+        hist_x_ticks.add_segments([[x, 0.5, 0] for x in x_major_pos], [[x, 0.3, 0] for x in x_major_pos])
+        hist_y_ticks = BatchedLines(stroke_color=WHITE, stroke_width=1.5)
+        hist_y_ticks.add_segments([[10.25, y, 0] for y in y_major_pos], [[10.05, y, 0] for y in y_major_pos])
+        
+        # Unlabeled minor ticks
+        hist_x_minor_ticks = BatchedLines(stroke_color=WHITE, stroke_width=1)
+        hist_x_minor_ticks.add_segments([[x, 0.5, 0] for x in self.degree_axis(x_minor)],
+                                        [[x, 0.35, 0] for x in self.degree_axis(x_minor)])
+        hist_y_minor_ticks = BatchedLines(stroke_color=WHITE, stroke_width=1)
+        hist_y_minor_ticks.add_segments([[10.25, y, 0] for y in self.count_axis(y_minor)],
+                                        [[10.15, y, 0] for y in self.count_axis(y_minor)])
+        self.add(hist_x_ticks, hist_y_ticks, hist_x_minor_ticks, hist_y_minor_ticks)
+        
+        for pos, val in zip(x_major_pos, x_major):
+            tick_label = label(f"{int(val)}", font_size=28, color=WHITE, font="sans-serif")
+            tick_label.move_to([pos, 0.05, 0])
+            self.add(tick_label)
+        for pos, val in zip(y_major_pos, y_major):
+            tick_label = label(f"{int(val)}", font_size=28, color=WHITE, font="sans-serif")
+            tick_label.move_to([9.55, pos, 0])
+            self.add(tick_label)
+    
+    def init_histogram(self):
+        """Initialize one histogram bar per degree bin, with height 0"""
+        edges = self.bin_edges
+        if self.degree_axis.log:
+            lefts, rights = self.degree_axis(edges[:-1]), self.degree_axis(edges[1:])
+        else:
+            # Bars span the integer degrees they hold, centred on them
+            lefts, rights = self.degree_axis(edges[:-1] - 0.5), self.degree_axis(edges[1:] - 0.5)
+        self.histogram = AnimatedHistogram(
+            bar_centers=(lefts + rights) / 2,
+            bar_width=rights - lefts,
+            baseline=0.5,
+            count_to_height=lambda count: self.count_axis(count) - 0.5,
+        )
+        self.degree_stats.set_bins(edges)
+        self.add(self.histogram)
+    
+    def histogram_counts(self):
+        """Current node count for each histogram bin"""
+        return self.degree_stats.bin_counts.copy()
+    
+    def update_histogram(self, histogram_duration=15/15):
+        """Animate the bars whose count changed since the last update"""
+        bar_animations = self.histogram.animate_counts(self.histogram_counts(), run_time=histogram_duration)
+        if bar_animations:
+            self.play(*bar_animations)
+        else:
+            self.wait(histogram_duration)
+    
+    def restore_state(self, events, n_nodes):
+        """
+        Jump to the state after the first n_nodes arrivals: their dots and
+        edges are added settled and the statistics and histogram are taken
+        from a DegreeIndex snapshot rather than replaying every step.
+        """
+        if not hasattr(events, 'target_offsets'):
+            raise ValueError(f"{type(self).__name__}: start_node needs a seekable GrowthEvents source")
+        offsets = events.target_offsets[:n_nodes + 1]
+        sources = np.repeat(np.arange(n_nodes), np.diff(offsets))
+        targets = events.targets[:offsets[-1]]
+        self.data_prefix.update(events.positions[:n_nodes], offsets, targets)
+        positions = self.data_to_manim(events.positions[:n_nodes])
+        self.node_positions = list(positions)
+        self.settled_dots.add_dots(positions)
+        self.settled_edges.add_segments(positions[sources], positions[targets])
+        
+        degrees = events.degree_index().degrees_at(n_nodes - 1)
+        self.degree_stats = DegreeStats.from_degrees(degrees)
+        self.degree_stats.set_bins(self.bin_edges)
+        self.histogram.set_counts(self.histogram_counts())
+    
+    def settle_current_elements(self, container=None):
+        """
+        Flatten the previous orange dot and connections to white.
+        In batched mode they are removed from container (default: the scene).
+        """
+        if self.batch_settled:
+            lines = [element for element in self.current_orange_elements if isinstance(element, Line)]
+            dots = [element for element in self.current_orange_elements if not isinstance(element, Line)]
+            if lines:
+                self.settled_edges.add_segments([line.get_start() for line in lines],
+                                                [line.get_end() for line in lines])
+            if dots:
+                self.settled_dots.add_dots([dot.get_center() for dot in dots])
+            (container or self).remove(*self.current_orange_elements)
+        else:
+            for element in self.current_orange_elements:
+                element.set_fill(WHITE)
+                # Only set stroke to white for connections (Lines), not dots (Circles)
+                if isinstance(element, Line):
+                    element.set_stroke(WHITE)
+        self.current_orange_elements = []
+    
+    def create_node_elements(self, event):
+        """Create the orange dot and connection lines for a growth event"""
+        position = self.data_to_manim(event.position)
+        self.node_positions.append(position)
+        target_positions = [self.node_positions[target] for target in event.targets]
         
         # Create circle with black stroke width 2 and orange fill
         dot = Circle(radius=0.15, stroke_color=BLACK, stroke_width=2, fill_color=self.orange, fill_opacity=1)
-        dot.move_to([x_manim, y_manim, 0])
+        dot.move_to(position)
         self.current_orange_elements.append(dot)
         
-        # Retrieve and draw connections to target nodes
+        # Draw connections to target nodes
         connections = []
-        for i in range(20):  # Max 20 targets per node
-            target_x_key = f'target_{i}_x'
-            target_y_key = f'target_{i}_y'
-            
-            if target_x_key not in node_data:
-                break  # No more targets
-            
-            target_x_str = node_data[target_x_key]
-            target_y_str = node_data[target_y_key]
-            
-            # Skip empty or None values
-            if not target_x_str or target_x_str == 'None':
-                break
-            
-            try:
-                target_x_orig = float(target_x_str)
-                target_y_orig = float(target_y_str)
-                
-                # Normalize target coordinates
-                target_x_normalized = ((target_x_orig + 5) / 10) * 2
-                target_y_normalized = ((target_y_orig + 3) / 6) * 2
-                
-                # Scale to Manim coordinates
-                target_x_manim = 0.28 + target_x_normalized * 4
-                target_y_manim = -0.25 + target_y_normalized * 4
-                
-                # Create line from current node to target
-                line = Line(start=np.array([x_manim, y_manim, 0]),
-                           end=np.array([target_x_manim, target_y_manim, 0]),
-                           stroke_color=self.orange, stroke_width=4)
-                connections.append(line)
-                self.current_orange_elements.append(line)
-            except (ValueError, KeyError):
-                break
+        for target_position in target_positions:
+            line = Line(start=position, end=target_position,
+                       stroke_color=self.orange, stroke_width=4)
+            connections.append(line)
+            self.current_orange_elements.append(line)
+        
+        # Connections go behind the dots
+        for conn in connections:
+            conn.set_z_index(-1)
+        return dot, connections
+    
+    def add_node(self, event):
+        """Create, add to scene, and return a dot for the given growth event"""
+        node_index = event.node_id
+        self.data_prefix.update(event.position, event.targets)
+        self.settle_current_elements()
+        
+        # Set animation durations based on node_index
+        timings = self.slow_node_timings if node_index < self.slow_nodes else self.fast_node_timings
+        dot_duration, connection_duration, histogram_duration, histo_wait_duration = timings
+        
+        dot, connections = self.create_node_elements(event)
         
         # Fade in the dot first
         self.play(FadeIn(dot, run_time=dot_duration))
         
         # Store dot and bring to front
-        self.dots.append(dot)
+        if not self.batch_settled:
+            self.dots.append(dot)
         self.bring_to_front(dot)
         
         # Draw connection lines growing from the new node simultaneously
         if connections:
-            # Set z-index before animating
-            for conn in connections:
-                conn.set_z_index(-1)
             create_animations = [Create(conn, run_time=connection_duration) for conn in connections]
             self.play(*create_animations)
         
         # Update histogram based on current degree distribution
-        self.update_histogram(node_index, histogram_duration)
+        self.degree_stats.add_node(node_index, event.targets)
+        self.update_histogram(histogram_duration)
         
         if histo_wait_duration > 0:
             self.wait(histo_wait_duration)
         
         return dot
     
+    def show_final_curve(self):
+        """Draw the curve over the final histogram and hold the last frame"""
+        # Create histogram curve over the bars
+        # Final counts come straight from the running statistics, or from an ensemble
+        curve_x = self.histogram.bar_centers
+        curve_counts = self.degree_stats.bin_counts
+        curve_animations = []
+        if self.ensemble_size:
+            ensemble = run_ensemble(self.ensemble_size, self.degree_stats.n_nodes, self.m_edges,
+                                    edges=self.bin_edges, seed=self.ensemble_seed)
+            curve_counts = ensemble.mean
+            error_bars = BatchedLines(stroke_color=self.orange, stroke_width=3)
+            low = self.count_axis(np.maximum(ensemble.mean - ensemble.stderr, 0))
+            high = self.count_axis(ensemble.mean + ensemble.stderr)
+            error_bars.add_segments(np.stack([curve_x, low, np.zeros(len(curve_x))], axis=1),
+                                    np.stack([curve_x, high, np.zeros(len(curve_x))], axis=1))
+            curve_animations.append(Create(error_bars, run_time=15/15))
+        if not self.count_axis.log and not self.degree_axis.log:
+            # Start the curve at degree 0 with count 0
+            curve_x = np.concatenate([[self.degree_axis(0)], curve_x])
+            curve_counts = np.concatenate([[0], curve_counts])
+        
+        # Create curve directly from data points without any smoothing
+        curve_points_array = np.stack([curve_x, self.count_axis(curve_counts), np.zeros(len(curve_x))], axis=1)
+        
+        # Create curve VMobject
+        curve = VMobject()
+        curve.set_points_as_corners(curve_points_array)
+        curve.set_stroke(color=self.orange, width=6)
+        
+        self.play(Create(curve, run_time=15/15), *curve_animations)
+
+        self.wait(2)
+    
     def construct(self):
         # --- CAMERA SETTINGS ---
         # 16:9 landscape aspect ratio
@@ -192,122 +430,61 @@ class NetworkGrowth(MovingCameraScene):
         # --- COORDINATE SYSTEM ---
         # (Left-side axes removed, but coordinate mapping still applies to dots and connections)
         
-        # --- LOAD NETWORK DATA ---
-        self.load_network_data()
-        
         # --- HISTOGRAM COORDINATE SYSTEM (Right Pane) ---
-        # X-axis (width)
-        hist_x_axis = Line(start=np.array([10.25, 0.5, 0]), end=np.array([15.25, 0.5, 0]), stroke_color=WHITE, stroke_width=2)
-        
-        # Y-axis (height - degree range 0 to 25)
-        hist_y_axis = Line(start=np.array([10.25, 0.5, 0]), end=np.array([10.25, 7.5, 0]), stroke_color=WHITE, stroke_width=2)
-        
-        # Y-axis ticks and labels (0 to 35 count range mapped to 0.5-7.5 axis)
-        hist_y_positions = np.linspace(0.5, 7.5, 8)  # 8 ticks for 0, 5, 10, 15, 20, 25, 30, 35
-        hist_y_values_labels = [0, 5, 10, 15, 20, 25, 30, 35]
-        
-        hist_y_ticks = []
-        hist_y_labels = []
-        
-        for pos, val in zip(hist_y_positions, hist_y_values_labels):
-            tick = Line(start=np.array([10.25, pos, 0]), end=np.array([10.05, pos, 0]), stroke_color=WHITE, stroke_width=1.5)
-            hist_y_ticks.append(tick)
-            
-            label = Text(f"{val}", font_size=28, color=WHITE, font="sans-serif")
-            label.move_to([9.55, pos, 0])
-            hist_y_labels.append(label)
-        
-        # Add unlabeled ticks at every integer count (0-35)
-        hist_y_minor_ticks = []
-        for count in range(0, 36):
-            y_manim = 0.5 + (count / 35.0) * 7.0
-            tick = Line(start=np.array([10.25, y_manim, 0]), end=np.array([10.15, y_manim, 0]), stroke_color=WHITE, stroke_width=1)
-            hist_y_minor_ticks.append(tick)
-        
-        # X-axis ticks and labels (for degree values 0-25)
-        hist_x_positions = np.linspace(10.25, 15.25, 6)  # 6 ticks
-        hist_x_values_labels = [0, 5, 10, 15, 20, 25]  # Degree values
-        
-        hist_x_ticks = []
-        hist_x_labels = []
-        
-        for pos, val in zip(hist_x_positions, hist_x_values_labels):
-            tick = Line(start=np.array([pos, 0.5, 0]), end=np.array([pos, 0.3, 0]), stroke_color=WHITE, stroke_width=1.5)
-            hist_x_ticks.append(tick)
-            
-            label = Text(f"{val}", font_size=28, color=WHITE, font="sans-serif")
-            label.move_to([pos, 0.05, 0])
-            hist_x_labels.append(label)
-        
-        # Add unlabeled ticks at every integer degree
-        hist_x_minor_ticks = []
-        for degree in range(0, 26):
-            x_manim = 10.25 + (degree / 25.0) * 5.0
-            tick = Line(start=np.array([x_manim, 0.5, 0]), end=np.array([x_manim, 0.35, 0]), stroke_color=WHITE, stroke_width=1)
-            hist_x_minor_ticks.append(tick)
-        
-        # Add histogram coordinate system
-        self.add(hist_x_axis, hist_y_axis)
-        self.add(*hist_y_ticks, *hist_y_labels)
-        self.add(*hist_y_minor_ticks)
-        self.add(*hist_x_ticks, *hist_x_labels)
-        self.add(*hist_x_minor_ticks)
+        # Events and axis ranges are set up in setup()
+        events = self.events
+        self.add_histogram_axes()
         
         # Add axis labels
-        x_axis_label = Text("number of connections", font_size=32, color=WHITE, font="sans-serif")
+        x_axis_label = label("number of connections", font_size=32, color=WHITE, font="sans-serif")
         x_axis_label.move_to([12.75, -0.5, 0])
         self.add(x_axis_label)
         
-        y_axis_label = Text("count", font_size=32, color=WHITE, font="sans-serif")
+        y_axis_label = label("count", font_size=32, color=WHITE, font="sans-serif")
         y_axis_label.rotate(np.pi / 2)
         y_axis_label.move_to([9.0, 4.0, 0])
         self.add(y_axis_label)
         
         # Initialize histogram bars with height 0
         self.init_histogram()
+        if self.batch_settled:
+            self.add(self.settled_edges, self.settled_dots)
 
         # --- PLOT NETWORK NODES ---
-        for node_index in range(60):
-            self.add_node(node_index)
+        if self.start_node:
+            self.restore_state(events, self.start_node)
+        if hasattr(events, 'between'):
+            events = events.between(self.start_node, self.stop_node)
+        else:
+            events = islice(events, self.start_node, self.stop_node)
+        for event in islice(events, max(self.slow_nodes - self.start_node, 0)):
+            self.add_node(event)
+        if self.coalesce_fast_phase:
+            # With data_cache every node is its own play call, so a data change
+            # only re-renders the calls from the changed node on
+            chunk_size = 1 if self.data_cache else self.fast_phase_chunk
+            while True:
+                chunk = list(islice(events, chunk_size))
+                if not chunk:
+                    break
+                for event in chunk:
+                    self.data_prefix.update(event.position, event.targets)
+                self.play(GrowthSequence(self, chunk, node_run_time=sum(self.fast_node_timings)))
+        else:
+            for event in events:
+                self.add_node(event)
 
-        # Create smooth histogram curve over the bars
-        from scipy.interpolate import CubicSpline
-        from collections import Counter
-        
-        final_node_index = 59  # Last node added (0-indexed)
-        node_data = self.network_data[final_node_index]
-        
-        # Get final degree counts
-        degrees = []
-        for i in range(final_node_index + 1):
-            degree_key = f'degree_at_node_{i}'
-            if degree_key in node_data:
-                degree = int(float(node_data[degree_key]))
-                if degree > 0:
-                    degrees.append(degree)
-        
-        degree_counts = Counter(degrees)
-        
-        # Create points for curve
-        curve_points = []
-        for degree in range(0, 26):  # Include 0 to 25
-            count = degree_counts.get(degree, 0)
-            bar_height = count * (7.0 / 35.0)  # Map to 0-35 scale
-            x_pos = 10.25 + (degree / 25.0) * 5.0
-            y_pos = 0.5 + bar_height
-            curve_points.append([x_pos, y_pos])
-        
-        x_vals = [p[0] for p in curve_points]
-        y_vals = [p[1] for p in curve_points]
-        
-        # Create curve directly from data points without any smoothing
-        curve_points_array = np.array([[x_vals[i], y_vals[i], 0] for i in range(len(x_vals))])
-        
-        # Create curve VMobject
-        curve = VMobject()
-        curve.set_points_as_corners(curve_points_array)
-        curve.set_stroke(color=self.orange, width=6)
-        
-        self.play(Create(curve, run_time=15/15))
+        if self.stop_node is None:
+            self.show_final_curve()
 
-        self.wait(2)
+
+class StreamingNetworkGrowth(NetworkGrowth):
+    """NetworkGrowth driven by an in-process growth run instead of a data file"""
+    n_nodes = 60
+    seed = 1
+    
+    # A generator cannot seek to a segment's first node: render in one piece
+    seekable = False
+    
+    def growth_events(self):
+        return stream_barabasi_albert(self.m_edges, self.n_nodes, seed=self.seed)
@@ -0,0 +1,164 @@
+from collections import defaultdict
+import numpy as np
+
+
+def grid_force_layout(n_nodes, sources, targets, iterations=50, k=None, seed=None,
+                      grid_size=512, direct_limit=1000):
+    """
+    Fruchterman-Reingold layout that scales to very large networks.
+
+    Attraction runs over the edge list (O(E)). Repulsion between all pairs is
+    approximated on a grid: node counts are binned into cells and convolved
+    with the k²/r repulsion kernel by FFT, so one iteration costs
+    O(N + G² log G) with G = min(grid_size, sqrt(N)) instead of O(N²).
+    Networks of up to direct_limit nodes use exact pairwise repulsion.
+    Returns an (n_nodes, 2) array of positions.
+    """
+    rng = np.random.default_rng(seed)
+    positions = rng.random((n_nodes, 2))
+    if n_nodes < 2:
+        return positions
+    if k is None:
+        k = 1 / np.sqrt(n_nodes)
+    sources = np.asarray(sources)
+    targets = np.asarray(targets)
+
+    if n_nodes <= direct_limit:
+        repulsion = lambda pos: _direct_repulsion(pos, k)
+    else:
+        grid = _RepulsionGrid(int(min(grid_size, max(16, np.sqrt(n_nodes)))))
+        repulsion = lambda pos: grid.repulsion(pos, k)
+
+    # Linear cooling, as in networkx.spring_layout
+    temperature = 0.1 * np.ptp(positions, axis=0).max()
+    cooling = temperature / (iterations + 1)
+    for _ in range(iterations):
+        displacement = repulsion(positions)
+        displacement += _edge_attraction(positions, sources, targets, k)
+        length = np.maximum(np.linalg.norm(displacement, axis=1), 1e-9)
+        positions += displacement * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+    return positions
+
+
+def _direct_repulsion(positions, k):
+    delta = positions[:, None, :] - positions[None, :, :]
+    distance_sq = np.maximum((delta ** 2).sum(axis=2), 1e-9)
+    return (delta * (k ** 2 / distance_sq)[:, :, None]).sum(axis=1)
+
+
+def _edge_attraction(positions, sources, targets, k):
+    """Pull both ends of every edge together with force d²/k"""
+    n_nodes = len(positions)
+    delta = positions[sources] - positions[targets]
+    pull = delta * (np.linalg.norm(delta, axis=1) / k)[:, None]
+    displacement = np.empty_like(positions)
+    for axis in range(2):
+        displacement[:, axis] = (np.bincount(targets, pull[:, axis], minlength=n_nodes)
+                                 - np.bincount(sources, pull[:, axis], minlength=n_nodes))
+    return displacement
+
+
+class _RepulsionGrid:
+    """Particle-mesh evaluation of the k²/r repulsion on a G x G grid"""
+
+    def __init__(self, size):
+        self.size = size
+        # Unit kernel r/|r|² in cell units over offsets -(G-1)..(G-1), laid
+        # out with wrap-around on a 2G grid so the FFT gives a linear convolution
+        offsets = np.fft.fftfreq(2 * size, 1 / (2 * size))
+        dx, dy = np.meshgrid(offsets, offsets, indexing='ij')
+        distance_sq = dx ** 2 + dy ** 2
+        distance_sq[0, 0] = 1  # No self-repulsion
+        self.kernel_x = np.fft.rfft2(dx / distance_sq)
+        self.kernel_y = np.fft.rfft2(dy / distance_sq)
+
+    def repulsion(self, positions, k):
+        size = self.size
+        low = positions.min(axis=0)
+        cell = max(np.ptp(positions, axis=0).max(), 1e-9) / size
+        cells = np.clip(((positions - low) / cell).astype(np.int64), 0, size - 1)
+        flat = cells[:, 0] * size + cells[:, 1]
+
+        density = np.zeros((2 * size, 2 * size))
+        density[:size, :size] = np.bincount(flat, minlength=size * size).reshape(size, size)
+        density_hat = np.fft.rfft2(density)
+        shape = density.shape
+        field_x = np.fft.irfft2(density_hat * self.kernel_x, s=shape)[:size, :size]
+        field_y = np.fft.irfft2(density_hat * self.kernel_y, s=shape)[:size, :size]
+
+        # Kernel is in cell units: scale by k² / cell to get k²/r in layout units
+        scale = k ** 2 / cell
+        return np.stack([field_x.ravel()[flat], field_y.ravel()[flat]], axis=1) * scale
+
+
+class IncrementalLayout:
+    """
+    Places arriving nodes one at a time, near the nodes they attach to.
+
+    Each new node starts at the mean of its targets and is relaxed against
+    its targets and the nodes in its neighbourhood only (found through a
+    spatial hash with cell size k). Existing nodes never move, so positions
+    stay stable as the network grows.
+
+    Positions are clipped to bounds, so k has to fit the number of nodes
+    into them: by default k = 0.8 * sqrt(area / expected_nodes) when bounds
+    and expected_nodes are given (0.8 for 60 nodes in the 10 x 6 data
+    range), otherwise 0.8.
+    """
+
+    def __init__(self, k=None, bounds=None, iterations=10, seed=None, expected_nodes=None):
+        if k is None:
+            k = 0.8
+            if bounds is not None and expected_nodes:
+                area = np.prod(np.subtract(bounds[1], bounds[0]))
+                k *= np.sqrt(area / expected_nodes)
+        self.k = k
+        self.bounds = bounds  # ((x_min, y_min), (x_max, y_max)) or None
+        self.iterations = iterations
+        self.rng = np.random.default_rng(seed)
+        self.positions = np.empty((64, 2))
+        self.n_nodes = 0
+        self.cells = defaultdict(list)  # {(i, j): [node ids]}
+
+    def add_node(self, targets):
+        """Place the next node and return its (x, y) position"""
+        k = self.k
+        anchors = self.positions[np.asarray(targets, dtype=np.int64)]
+        angle = self.rng.uniform(0, 2 * np.pi)
+        position = np.array([np.cos(angle), np.sin(angle)]) * k
+        if len(anchors):
+            position += anchors.mean(axis=0)
+
+        temperature = k
+        for _ in range(self.iterations):
+            neighbors = self.positions[self._nearby(position)]
+            delta = position - neighbors
+            distance_sq = np.maximum((delta ** 2).sum(axis=1), 1e-9)
+            displacement = (delta * (k ** 2 / distance_sq)[:, None]).sum(axis=0)
+            pull = anchors - position
+            displacement += (pull * (np.linalg.norm(pull, axis=1) / k)[:, None]).sum(axis=0)
+            length = max(np.linalg.norm(displacement), 1e-9)
+            position += displacement * min(length, temperature) / length
+            temperature -= k / self.iterations
+        if self.bounds is not None:
+            position = np.clip(position, self.bounds[0], self.bounds[1])
+
+        if self.n_nodes == len(self.positions):
+            self.positions = np.concatenate([self.positions, np.empty_like(self.positions)])
+        self.positions[self.n_nodes] = position
+        self.cells[self._cell(position)].append(self.n_nodes)
+        self.n_nodes += 1
+        return position
+
+    def _cell(self, position):
+        return int(np.floor(position[0] / self.k)), int(np.floor(position[1] / self.k))
+
+    def _nearby(self, position):
+        """Ids of nodes in the 3 x 3 block of cells around position"""
+        i, j = self._cell(position)
+        nearby = []
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                nearby.extend(self.cells.get((i + di, j + dj), ()))
+        return np.array(nearby, dtype=np.int64)
@@ -0,0 +1,225 @@
+from collections import Counter
+import numpy as np
+
+
+def degree_bins(max_degree, log=False, max_bins=50):
+    """
+    Bin edges for a degree histogram; bin i holds degrees in
+    [edges[i], edges[i+1]). Log bins double in width (1, 2, 4, 8, ...),
+    linear bins are one degree wide unless that would exceed max_bins.
+    """
+    max_degree = max(int(max_degree), 1)
+    if log:
+        n_bins = int(np.floor(np.log2(max_degree))) + 1
+        return 2 ** np.arange(n_bins + 1)
+    width = int(np.ceil(max_degree / max_bins))
+    return np.arange(1, max_degree + width + 1, width)
+
+
+def binned_degree_counts(degrees, edges):
+    """Number of nodes per degree bin, vectorized; degree 0 is not counted"""
+    degrees = np.asarray(degrees)
+    bins = np.searchsorted(edges, degrees[degrees > 0], side='right') - 1
+    bins = np.minimum(bins, len(edges) - 2)  # Overflow goes into the last bin
+    return np.bincount(bins, minlength=len(edges) - 1)
+
+
+def peak_binned_degree_counts(target_offsets, targets, edges):
+    """
+    Highest node count each degree bin reaches after any node's arrival
+    (see binned_degree_counts), for a run given as target_offsets, targets.
+    A bin's count can rise above its final value and fall again as nodes
+    grow out of it. One vectorized pass over all degree increments.
+    """
+    target_offsets = np.asarray(target_offsets)
+    targets = np.asarray(targets)
+    n_nodes = len(target_offsets) - 1
+    n_bins = len(edges) - 1
+    sources = np.repeat(np.arange(n_nodes), np.diff(target_offsets))
+    # Every edge raises the degree of its source, then of its target
+    nodes = np.stack([sources, targets], axis=1).ravel()
+    steps = np.repeat(sources, 2)  # Arrival after which the change is shown
+    if len(nodes) == 0:
+        return np.zeros(n_bins, dtype=np.int64)
+    # New degree of the node at each increment: its running occurrence count
+    order = np.argsort(nodes, kind='stable')
+    sorted_nodes = nodes[order]
+    group_start = np.flatnonzero(np.r_[True, sorted_nodes[1:] != sorted_nodes[:-1]])
+    rank = np.arange(len(nodes)) - np.repeat(group_start, np.diff(np.r_[group_start, len(nodes)]))
+    new_degree = np.empty(len(nodes), dtype=np.int64)
+    new_degree[order] = rank + 1
+
+    def bin_of(degrees):
+        return np.minimum(np.searchsorted(edges, degrees, side='right') - 1, n_bins - 1)
+
+    # +1 in the new degree's bin, -1 in the old one (degree 0 is not counted)
+    moved = new_degree > 1
+    bins = np.concatenate([bin_of(new_degree), bin_of(new_degree[moved] - 1)])
+    deltas = np.concatenate([np.ones(len(nodes)), -np.ones(moved.sum())])
+    times = np.concatenate([steps, steps[moved]])
+    keep = bins >= 0
+    # Net change per (bin, arrival), in bin-then-time order, summed up per bin
+    keys, inverse = np.unique(bins[keep] * n_nodes + times[keep], return_inverse=True)
+    net = np.bincount(inverse, deltas[keep]).astype(np.int64)
+    key_bins = keys // n_nodes
+    counts = np.cumsum(net)
+    bin_start = np.flatnonzero(np.r_[True, key_bins[1:] != key_bins[:-1]])
+    counts -= np.repeat(np.r_[0, counts[bin_start[1:] - 1]], np.diff(np.r_[bin_start, len(counts)]))
+    peaks = np.zeros(n_bins, dtype=np.int64)
+    peaks[key_bins[bin_start]] = np.maximum.reduceat(counts, bin_start)
+    return np.maximum(peaks, 0)
+
+
+class DegreeIndex:
+    """
+    Answers "degree of node i after step t" for a whole growth run.
+
+    Node t arrives at step t together with its edges. For every node the
+    sorted arrival steps of its edges are stored (as one sorted array of
+    node * n_steps + step keys), so a degree at any step is a binary
+    search and a whole snapshot is one vectorized search, without replaying
+    the growth or storing N² degrees.
+    """
+
+    def __init__(self, target_offsets, targets):
+        target_offsets = np.asarray(target_offsets)
+        targets = np.asarray(targets)
+        self.n_nodes = len(target_offsets) - 1
+        sources = np.repeat(np.arange(self.n_nodes), np.diff(target_offsets))
+        # Both ends of an edge gain a degree when its source arrives
+        nodes = np.concatenate([sources, targets])
+        steps = np.concatenate([sources, sources])
+        self.keys = np.sort(nodes * self.n_nodes + steps)
+        self.node_offsets = np.searchsorted(self.keys, np.arange(self.n_nodes + 1) * self.n_nodes)
+
+    def edge_steps(self, node):
+        """Sorted steps at which node gained its edges"""
+        keys = self.keys[self.node_offsets[node]:self.node_offsets[node + 1]]
+        return keys - node * self.n_nodes
+
+    def degree(self, node, step):
+        """Degree of node (scalar or array) once node `step` has arrived"""
+        node = np.asarray(node)
+        position = np.searchsorted(self.keys, node * self.n_nodes + step, side='right')
+        return position - self.node_offsets[node]
+
+    def degrees_at(self, step):
+        """Degrees of nodes 0..step once node `step` has arrived"""
+        return self.degree(np.arange(step + 1), step)
+
+    def histogram_at(self, step, edges=None):
+        """
+        Nodes per degree once node `step` has arrived (index = degree,
+        degree 0 not counted), or per degree bin if bin edges are given
+        """
+        degrees = self.degrees_at(step)
+        if edges is not None:
+            return binned_degree_counts(degrees, edges)
+        histogram = np.bincount(degrees)
+        histogram[:1] = 0
+        return histogram
+
+
+class DegreeStats:
+    """
+    Degree statistics of a growing network, updated one node at a time.
+
+    Each new node only changes the degrees of itself and its targets, so
+    histogram, max degree, mean degree and hub list are kept up to date
+    with O(m) work per node instead of recounting every degree.
+    """
+
+    def __init__(self, top_k=5):
+        self.degrees = []  # degrees[node_id] = current degree
+        self.histogram = Counter()  # {degree: number of nodes}, degree 0 not counted
+        self.max_degree = 0
+        self.n_edges = 0
+        self.top_k = top_k
+        self.hubs = []  # Up to top_k node ids, highest degree first
+        self.bin_edges = None
+        self.bin_counts = None  # Node count per bin, once set_bins was called
+        self._bin_of_degree = None
+
+    def set_bins(self, edges):
+        """Also keep node counts per degree bin (see degree_bins) up to date"""
+        self.bin_edges = np.asarray(edges)
+        self.bin_counts = binned_degree_counts(self.degrees, self.bin_edges)
+        # Lookup table degree -> bin; degrees past the table use the last bin
+        degrees = np.arange(self.bin_edges[-1])
+        self._bin_of_degree = np.clip(np.searchsorted(self.bin_edges, degrees, side='right') - 1,
+                                      -1, len(self.bin_edges) - 2).tolist()
+
+    def _bin(self, degree):
+        if degree < len(self._bin_of_degree):
+            return self._bin_of_degree[degree]
+        return len(self.bin_edges) - 2
+
+    @classmethod
+    def from_degrees(cls, degrees, top_k=5):
+        """Statistics for a network with the given node degrees (e.g. from DegreeIndex.degrees_at)"""
+        stats = cls(top_k=top_k)
+        degrees = np.asarray(degrees)
+        stats.degrees = degrees.tolist()
+        counts = np.bincount(degrees) if len(degrees) else np.zeros(1, dtype=np.int64)
+        stats.histogram = Counter({degree: int(count) for degree, count in enumerate(counts)
+                                   if degree > 0 and count > 0})
+        stats.max_degree = int(degrees.max()) if len(degrees) else 0
+        stats.n_edges = int(degrees.sum()) // 2
+        # Connected nodes only, highest degree first, ties broken by node id as in _update_hubs
+        order = np.lexsort((np.arange(len(degrees)), -degrees))
+        stats.hubs = order[degrees[order] > 0][:top_k].tolist()
+        return stats
+
+    @property
+    def n_nodes(self):
+        return len(self.degrees)
+
+    @property
+    def mean_degree(self):
+        if not self.degrees:
+            return 0.0
+        return 2 * self.n_edges / len(self.degrees)
+
+    def top_hubs(self):
+        """Return [(node_id, degree), ...] for the current top_k hubs"""
+        return [(node, self.degrees[node]) for node in self.hubs]
+
+    def add_node(self, node_id, targets):
+        """Register a new node and the edges it attaches to existing nodes"""
+        if node_id != len(self.degrees):
+            raise ValueError(f"Expected node {len(self.degrees)}, got {node_id}")
+        self.degrees.append(0)
+        for target in targets:
+            self._increment(node_id)
+            self._increment(target)
+            self.n_edges += 1
+
+    def _increment(self, node):
+        """Raise the degree of one node by one and apply the histogram delta"""
+        old = self.degrees[node]
+        if old > 0:
+            self.histogram[old] -= 1
+            if self.histogram[old] == 0:
+                del self.histogram[old]
+        new = old + 1
+        self.degrees[node] = new
+        self.histogram[new] += 1
+        if self.bin_counts is not None:
+            if old > 0:
+                self.bin_counts[self._bin(old)] -= 1
+            self.bin_counts[self._bin(new)] += 1
+        self.max_degree = max(self.max_degree, new)
+        self._update_hubs(node)
+
+    def _update_hubs(self, node):
+        # Degrees only ever grow, so a node can only enter the list by
+        # overtaking the weakest hub
+        key = lambda n: (-self.degrees[n], n)
+        if node not in self.hubs:
+            if len(self.hubs) < self.top_k:
+                self.hubs.append(node)
+            elif self.hubs and key(node) < key(self.hubs[-1]):
+                self.hubs[-1] = node
+            else:
+                return
+        self.hubs.sort(key=key)
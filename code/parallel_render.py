@@ -0,0 +1,103 @@
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from manim import tempconfig
+from stream_export import export_scene, load_scene_class
+
+
+def segment_bounds(durations, n_segments):
+    """
+    (start, stop) of up to n_segments contiguous step ranges covering all
+    steps, split where the cumulative duration crosses equal shares of the
+    total so every segment plays about equally long.
+    """
+    durations = np.asarray(durations, dtype=float)
+    ends = np.cumsum(durations)
+    n_segments = min(n_segments, len(durations))
+    shares = ends[-1] * np.arange(1, n_segments) / n_segments
+    # A step goes to the segment its midpoint falls in
+    cuts = np.searchsorted(ends - durations / 2, shares)
+    bounds = np.unique(np.concatenate([[0], cuts, [len(durations)]]))
+    return [(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _render_segment(scene_file, scene_name, start, stop, output_path, resolution, frame_rate):
+    """Render steps [start, stop) of a scene (stop None: to the end) into output_path"""
+    scene_class = load_scene_class(scene_file, scene_name)
+    start_attribute, stop_attribute = scene_class.segment_attributes
+    # Labels were pre-warmed once by the parent; don't start a pool per worker
+    segment_class = type(scene_name, (scene_class,),
+                         {start_attribute: start, stop_attribute: stop, 'label_workers': 0})
+    export_scene(segment_class, output_path, resolution=resolution, frame_rate=frame_rate)
+    return output_path
+
+
+def render_parallel(scene_file, scene_name, output_path, n_segments=None, max_workers=None,
+                    resolution=None, frame_rate=None):
+    """
+    Render a scene as contiguous step ranges in a process pool and join them.
+
+    The scene class declares seekable = True when it can start at any step,
+    segment_attributes, the names of its start and stop step attributes, and
+    a step_durations() classmethod giving the seconds of every step;
+    segments are balanced by duration. Its labels are
+    pre-warmed once here, before the workers start. Each worker renders
+    a subclass with those attributes set; the scene rebuilds its state at the
+    start step from the data instead of replaying the steps before it. The
+    segments share one encoding, so ffmpeg's concat demuxer joins them by
+    stream copy, without re-encoding. output_path must be a video
+    (.mp4, .webm or .mov), not a GIF.
+    """
+    scene_class = load_scene_class(scene_file, scene_name)
+    if not getattr(scene_class, 'seekable', False):
+        raise ValueError(f"{scene_name} cannot start at an arbitrary step (not seekable); "
+                         "render it in one piece")
+    n_segments = n_segments or max_workers or os.cpu_count()
+    bounds = segment_bounds(scene_class.step_durations(), n_segments)
+    with tempconfig({'dry_run': True}):
+        scene_class().setup()  # Fills the SVG text cache the workers read
+    extension = os.path.splitext(str(output_path))[1] or '.mp4'
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"segment_{i:03d}{extension}") for i in range(len(bounds))]
+        # The last segment plays to the end, including the scene's outro
+        stops = [stop for _, stop in bounds[:-1]] + [None]
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(_render_segment, [scene_file] * len(bounds), [scene_name] * len(bounds),
+                          [start for start, _ in bounds], stops, paths,
+                          [resolution] * len(bounds), [frame_rate] * len(bounds)))
+
+        list_path = os.path.join(tmp, 'segments.txt')
+        with open(list_path, 'w') as f:
+            f.writelines(f"file '{path}'\n" for path in paths)
+        subprocess.run(['ffmpeg', '-y', '-loglevel', 'error', '-f', 'concat', '-safe', '0',
+                        '-i', list_path, '-c', 'copy', str(output_path)], check=True)
+    return output_path
+
+
+if __name__ == '__main__':
+    # Usage (from the repository root, where the scenes find their data):
+    #   python code/parallel_render.py code/network_growth.py NetworkGrowth \
+    #       -o network_growth.mp4 -j 8
+    parser = argparse.ArgumentParser(description="Render a scene in parallel segments and join them")
+    parser.add_argument('file', help="Python file containing the scene")
+    parser.add_argument('scene', help="Name of the scene class")
+    parser.add_argument('-o', '--output', help="Output video (default: <scene>.mp4)")
+    parser.add_argument('-j', '--jobs', type=int, help="Worker processes (default: all cores)")
+    parser.add_argument('-n', '--segments', type=int, help="Number of segments (default: one per worker)")
+    parser.add_argument('-r', '--resolution', help="Pixel width,height, e.g. 600,600")
+    parser.add_argument('--fps', type=float, help="Frame rate")
+    args = parser.parse_args()
+
+    if shutil.which('ffmpeg') is None:
+        parser.error("ffmpeg is required to join the segments")
+    resolution = tuple(int(v) for v in args.resolution.split(',')) if args.resolution else None
+    output = args.output or f"{args.scene}.mp4"
+    if output.endswith('.gif'):
+        parser.error("segments are joined by stream copy; render a video and convert it afterwards")
+    render_parallel(args.file, args.scene, output, n_segments=args.segments, max_workers=args.jobs,
+                    resolution=resolution, frame_rate=args.fps)
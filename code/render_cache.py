@@ -0,0 +1,117 @@
+import glob
+import hashlib
+import inspect
+import os
+from manim import *
+import numpy as np
+from stream_export import ScopedConfig
+
+
+class PrefixFingerprint:
+    """
+    Running hash over the data a scene has consumed so far. Each update
+    chains onto the previous digest, so the digest after step k identifies
+    the data of steps 0..k and is unaffected by anything later.
+    """
+
+    def __init__(self):
+        self.digest = hashlib.sha256(b'').hexdigest()
+
+    def update(self, *values):
+        h = hashlib.sha256(self.digest.encode())
+        for value in values:
+            value = np.ascontiguousarray(value)
+            h.update(f"{value.dtype}{value.shape}".encode())
+            h.update(value.tobytes())
+        self.digest = h.hexdigest()
+        return self.digest
+
+
+def code_fingerprint(scene_class):
+    """Hash of every Python file next to the module defining scene_class"""
+    h = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(os.path.dirname(inspect.getfile(scene_class)), '*.py'))):
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+class DataCacheFileWriter(SceneFileWriter):
+    """
+    Partial movie files keyed on the data each animation depends on.
+
+    The key of play call i combines the scene code, the output settings,
+    the scene's render_inputs() (data-derived values every frame depends
+    on, such as axis ranges), the data prefix consumed before the call and
+    i itself. Calls whose key already has a partial movie are skipped; a
+    data change only re-renders the calls from the first changed step on.
+    """
+
+    def __init__(self, renderer, scene_name, scene=None, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.scene = scene
+        self.base_key = None
+
+    def animation_key(self):
+        if self.base_key is None:
+            base = PrefixFingerprint()
+            base.update(np.frombuffer(code_fingerprint(type(self.scene)).encode(), dtype=np.uint8))
+            base.update(np.array([config.pixel_width, config.pixel_height, config.frame_rate]))
+            for value in self.scene.render_inputs():
+                base.update(value)
+            self.base_key = base.digest
+        h = hashlib.sha256(f"{self.base_key}{self.scene.data_prefix.digest}{self.renderer.num_plays}".encode())
+        return f"data_{h.hexdigest()[:32]}"
+
+    def add_partial_movie_file(self, hash_animation):
+        if hash_animation is None or not hasattr(self, "partial_movie_directory") or not write_to_movie():
+            return super().add_partial_movie_file(hash_animation)
+        key = self.animation_key()
+        path = self.partial_movie_directory / f"{key}{config['movie_file_extension']}"
+        if path.exists():
+            logger.info(f"Animation {self.renderer.num_plays} : Using cached data (key : {key})")
+            # Same bookkeeping as a hash hit in CairoRenderer.play
+            self.renderer.skip_animations = True
+            self.renderer.time += self.scene.duration
+        self.partial_movie_files.append(str(path))
+        self.sections[-1].partial_movie_files.append(str(path))
+
+    def clean_cache(self):
+        """
+        Keep every partial movie this run uses; only other files are evicted
+        (least recently accessed first) beyond max_files_cached. Manim's own
+        cleanup counts this run's files too and would delete part of them
+        whenever a scene has more play calls than the limit.
+        """
+        in_use = {os.path.basename(path) for path in self.partial_movie_files if path}
+        stale = [path for path in self.partial_movie_directory.iterdir()
+                 if path.name != "partial_movie_file_list.txt" and path.name not in in_use]
+        excess = len(stale) - config["max_files_cached"]
+        if excess > 0:
+            for path in sorted(stale, key=lambda path: path.stat().st_atime)[:excess]:
+                path.unlink()
+
+
+class DataAwareCache(ScopedConfig):
+    """
+    Scene mixin: with data_cache set, partial movie files are cached by
+    DataCacheFileWriter instead of manim's hash of the scene state.
+
+    Scenes feed every piece of data they consume into self.data_prefix
+    (a PrefixFingerprint) before the play calls that show it, and return
+    the values all frames depend on from render_inputs(). This takes
+    precedence over a SingleStream writer.
+    """
+    data_cache = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.data_prefix = PrefixFingerprint()
+        if self.data_cache and write_to_movie() and not config.dry_run:
+            self.renderer.file_writer = DataCacheFileWriter(self.renderer, type(self).__name__, scene=self)
+            # Keys come from the data; skip manim's hash of the scene state
+            self.set_scene_config(disable_caching=True)
+
+    def render_inputs(self):
+        """Data-derived values every frame depends on"""
+        return []
@@ -0,0 +1,237 @@
+import argparse
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from manim import *
+import numpy as np
+
+# ffmpeg output options: one palette for the whole clip from the pixels that
+# change between frames, and only the changed rectangle re-encoded per frame
+GIF_OUTPUT_ARGS = [
+    '-vf', 'split[s0][s1];[s0]palettegen=stats_mode=diff[p];[s1][p]paletteuse=diff_mode=rectangle',
+    '-loop', '0',
+]
+# Video output options, matching what manim uses for its partial movie files
+MP4_OUTPUT_ARGS = ['-c:v', 'libx264', '-pix_fmt', 'yuv420p', '-crf', '23', '-movflags', '+faststart']
+WEBM_OUTPUT_ARGS = ['-c:v', 'libvpx-vp9', '-pix_fmt', 'yuva420p', '-auto-alt-ref', '1']
+MOV_OUTPUT_ARGS = ['-c:v', 'qtrle', '-pix_fmt', 'argb']
+
+
+def output_args_for(path):
+    """ffmpeg output options for the container given by path's extension"""
+    extension = os.path.splitext(str(path))[1].lower()
+    return {'.gif': GIF_OUTPUT_ARGS, '.webm': WEBM_OUTPUT_ARGS,
+            '.mov': MOV_OUTPUT_ARGS}.get(extension, MP4_OUTPUT_ARGS)
+
+
+def pipe_command(output_path, output_args, width, height, frame_rate):
+    """ffmpeg command encoding raw RGBA frames from stdin into output_path"""
+    return [
+        'ffmpeg', '-y', '-loglevel', 'error',
+        '-f', 'rawvideo', '-pix_fmt', 'rgba',
+        '-s', f"{width}x{height}",
+        '-r', str(frame_rate),
+        '-i', '-',
+        *output_args,
+        str(output_path),
+    ]
+
+
+def check_encoders(extensions=('.gif', '.mp4'), size=(64, 36), n_frames=3):
+    """
+    Smoke check of the export pipeline without rendering a scene: encode a
+    few blank frames through the same ffmpeg command into a temporary file
+    per extension, then optimize the GIF with gifsicle if available.
+    Returns a list of problems, empty if everything works.
+    """
+    if shutil.which('ffmpeg') is None:
+        return ["ffmpeg is not on the PATH"]
+    problems = []
+    frame = np.zeros((size[1], size[0], 4), dtype=np.uint8).tobytes()
+    with tempfile.TemporaryDirectory() as tmp:
+        for extension in extensions:
+            path = os.path.join(tmp, f"check{extension}")
+            result = subprocess.run(pipe_command(path, output_args_for(path), *size, 15),
+                                    input=frame * n_frames, capture_output=True)
+            written = os.path.exists(path) and os.path.getsize(path) > 0
+            if result.returncode != 0 or not written:
+                problems.append(f"ffmpeg could not write {extension}: {result.stderr.decode().strip()}")
+            elif extension == '.gif' and shutil.which('gifsicle'):
+                if subprocess.run(['gifsicle', '-O3', '--batch', path], capture_output=True).returncode != 0:
+                    problems.append("gifsicle -O3 failed")
+    return problems
+
+
+class PipeFileWriter(SceneFileWriter):
+    """
+    Scene file writer that streams every rendered frame into one ffmpeg
+    process as raw RGBA.
+
+    There are no partial movie files, no concat pass and no second decode:
+    ffmpeg encodes straight to output_path with the given output_args (by
+    default chosen from the extension: an optimized GIF, or a video like
+    manim's own). If optimize_gif is set and gifsicle is on the PATH, a
+    finished GIF gets a gifsicle -O3 pass as well.
+    """
+
+    def __init__(self, renderer, scene_name, output_path=None, output_args=None,
+                 optimize_gif=True, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.output_path = str(output_path or f"{scene_name}.gif")
+        self.output_args = list(output_args or output_args_for(self.output_path))
+        self.optimize_gif = optimize_gif
+        self.process = None
+
+    def open_pipe(self):
+        if shutil.which('ffmpeg') is None:
+            raise RuntimeError(f"Writing {self.output_path} needs an ffmpeg binary on the PATH")
+        command = pipe_command(self.output_path, self.output_args, config.pixel_width,
+                               config.pixel_height, config.frame_rate)
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    # Every play call goes into the same stream: nothing is cached or combined
+    def is_already_cached(self, hash_invocation):
+        return False
+
+    def add_partial_movie_file(self, hash_animation):
+        self.partial_movie_files.append(None)
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if allow_write and self.process is None:
+            self.open_pipe()
+
+    def end_animation(self, allow_write=False):
+        pass
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if self.process is None:
+            self.open_pipe()
+        data = np.ascontiguousarray(frame_or_renderer, dtype=np.uint8).tobytes()
+        for _ in range(num_frames):
+            self.process.stdin.write(data)
+
+    def finish(self):
+        if self.process is None:
+            return
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"ffmpeg failed writing {self.output_path}")
+        self.process = None
+        gifsicle = shutil.which('gifsicle')
+        if self.optimize_gif and gifsicle and self.output_path.endswith('.gif'):
+            subprocess.run([gifsicle, '-O3', '--batch', self.output_path], check=True)
+        logger.info(f"File ready at {self.output_path}")
+
+
+class ScopedConfig:
+    """
+    Scene mixin for global config changes that belong to one scene:
+    set_scene_config changes them and tear_down restores the values from
+    before the scene, so later scenes rendered in the same process are
+    unaffected. When several mixins change the same key, the first saved
+    value is the one restored.
+    """
+
+    def set_scene_config(self, **values):
+        if not hasattr(self, 'config_before_scene'):
+            self.config_before_scene = {}
+        for key, value in values.items():
+            self.config_before_scene.setdefault(key, config[key])
+            config[key] = value
+
+    def tear_down(self):
+        for key, value in getattr(self, 'config_before_scene', {}).items():
+            config[key] = value
+        super().tear_down()
+
+
+class SingleStream(ScopedConfig):
+    """
+    Scene mixin: with single_stream set, the whole scene is written through
+    one PipeFileWriter into the file manim would produce anyway, instead of
+    one partial movie file per play call plus a concat pass. For scenes made
+    of many short play calls.
+
+    Off by default: the pipe needs an ffmpeg binary on the PATH (manim itself
+    encodes through PyAV), writes no sections and caches nothing. Without
+    ffmpeg, or with save_sections, the scene keeps manim's own writer.
+    """
+    single_stream = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if not (self.single_stream and write_to_movie() and not config.dry_run):
+            return
+        if shutil.which('ffmpeg') is None or config.save_sections:
+            logger.warning(f"{type(self).__name__}: single_stream needs ffmpeg on the PATH and no "
+                           "saved sections; using manim's file writer")
+            return
+        writer = self.renderer.file_writer
+        output_path = writer.gif_file_path if is_gif_format() else writer.movie_file_path
+        self.renderer.file_writer = PipeFileWriter(self.renderer, type(self).__name__,
+                                                   output_path=output_path, optimize_gif=False)
+        # Nothing is cached per animation, so skip hashing every play call
+        self.set_scene_config(disable_caching=True)
+
+
+def load_scene_class(path, scene_name):
+    """Import the scene module at path (its folder on sys.path) and return the class"""
+    path = os.path.abspath(path)
+    sys.path.insert(0, os.path.dirname(path))
+    spec = importlib.util.spec_from_file_location(os.path.splitext(os.path.basename(path))[0], path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, scene_name)
+
+
+def export_scene(scene_class, output_path, output_args=None, resolution=None,
+                 frame_rate=None, optimize_gif=True):
+    """Render scene_class straight into output_path through a PipeFileWriter"""
+    overrides = {'disable_caching': True}
+    if resolution is not None:
+        overrides['pixel_width'], overrides['pixel_height'] = resolution
+    if frame_rate is not None:
+        overrides['frame_rate'] = frame_rate
+    with tempconfig(overrides):
+        scene = scene_class()
+        scene.renderer.file_writer = PipeFileWriter(
+            scene.renderer, scene_class.__name__, output_path=output_path,
+            output_args=output_args, optimize_gif=optimize_gif,
+        )
+        scene.render()
+
+
+if __name__ == '__main__':
+    # Usage (from the repository root, where the scenes find their data):
+    #   python code/stream_export.py code/trial_averaging.py TrialAveraging \
+    #       -o trial_averaging_optimized.gif -r 600,338 --fps 15
+    # The output format follows the extension (.gif, .mp4, .webm, .mov).
+    # Check the encoders alone with: python code/stream_export.py --check
+    parser = argparse.ArgumentParser(description="Render a scene straight to an optimized GIF or a video")
+    parser.add_argument('file', nargs='?', help="Python file containing the scene")
+    parser.add_argument('scene', nargs='?', help="Name of the scene class")
+    parser.add_argument('-o', '--output', help="Output file (default: <scene>.gif)")
+    parser.add_argument('-r', '--resolution', help="Pixel width,height, e.g. 600,600")
+    parser.add_argument('--fps', type=float, help="Frame rate")
+    parser.add_argument('--no-gifsicle', action='store_true', help="Skip the gifsicle -O3 pass")
+    parser.add_argument('--check', action='store_true',
+                        help="Only check that ffmpeg (and gifsicle) can encode GIF and MP4, then exit")
+    args = parser.parse_args()
+
+    if args.check:
+        problems = check_encoders()
+        for problem in problems:
+            print(f"export check: {problem}", file=sys.stderr)
+        print("export check: " + ("failed" if problems else "ok"))
+        sys.exit(1 if problems else 0)
+    if args.file is None or args.scene is None:
+        parser.error("file and scene are required (or use --check)")
+    if shutil.which('ffmpeg') is None:
+        parser.error("ffmpeg is required on the PATH; run with --check to test the encoders")
+
+    resolution = tuple(int(v) for v in args.resolution.split(',')) if args.resolution else None
+    export_scene(load_scene_class(args.file, args.scene), args.output or f"{args.scene}.gif",
+                 resolution=resolution, frame_rate=args.fps, optimize_gif=not args.no_gifsicle)
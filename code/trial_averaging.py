@@ -1,5 +1,7 @@
 from manim import *
 import numpy as np
+from fast_mobjects import BatchedVMobject, MorphPoints, corner_points, simplify_curve
+from label_cache import label, prewarm_labels
 
 def wobbly_curve(x, shift=10):
     """
@@ -13,7 +15,6 @@ def wobbly_curve(x, shift=10):
     peak2 = np.exp(-((x - 6) ** 2) / 0.4) * 2.0
     
     # Natural wobble (noise)
-    np.random.seed(42)  # For reproducibility
     wobble = np.sin(x * 1.5) * 0.15 + np.cos(x * 0.8) * 0.1
     
     return peak1 + peak2 + wobble + shift
@@ -29,7 +30,6 @@ def wobbly_curve2(x, shift=7):
     peak2 = np.exp(-((x - 8) ** 2) / 0.45) * 1.1
     
     # Different natural wobble pattern
-    np.random.seed(123)  # Different seed for different pattern
     wobble = np.sin(x * 1.2) * 0.12 + np.cos(x * 0.9) * 0.13
     
     return peak1 + peak2 + wobble + shift
@@ -48,10 +48,89 @@ def wobbly_curve3(x, shift=4):
     peak3 = np.exp(-((x - 9) ** 2) / 0.35) * 0.8
     
     # Different natural wobble pattern
-    np.random.seed(456)  # Different seed for different pattern
     wobble = np.sin(x * 1.3) * 0.14 + np.cos(x * 0.7) * 0.11
     
     return peak1 + peak2 + peak3 + wobble + shift
+
+
+def random_trials(x, n_trials, rng):
+    """
+    Sample n_trials random curves in the style of the wobbly curves above:
+    two or three Gaussian peaks plus a slow wobble, all drawn from rng.
+    Returns an (n_trials, len(x)) array.
+    """
+    x = np.asarray(x, dtype=float)[None, None, :]
+    n_peaks = 3
+    centers = rng.uniform(1, 9, (n_trials, n_peaks, 1))
+    widths = rng.uniform(0.3, 0.45, (n_trials, n_peaks, 1))
+    heights = rng.uniform(0.8, 2.0, (n_trials, n_peaks, 1))
+    heights[:, 2] *= rng.random((n_trials, 1)) < 0.5  # Third peak in about half the trials
+    peaks = (np.exp(-((x - centers) ** 2) / widths) * heights).sum(axis=1)
+    
+    frequencies = rng.uniform([1.2, 0.7], [1.5, 0.9], (n_trials, 2))
+    amplitudes = rng.uniform(0.1, 0.15, (n_trials, 2))
+    phases = rng.uniform(0, 2 * np.pi, (n_trials, 2))
+    x = x[0]
+    wobble = (np.sin(x * frequencies[:, :1] + phases[:, :1]) * amplitudes[:, :1]
+              + np.cos(x * frequencies[:, 1:] + phases[:, 1:]) * amplitudes[:, 1:])
+    return peaks + wobble
+
+
+class TrialEngine:
+    """
+    Runs random trials on a fixed x grid and keeps their running mean and
+    variance per x (Welford, merged block by block).
+    
+    Trials are drawn in blocks of block_size as one array each. Every block
+    gets its own Generator, spawned from one SeedSequence, so streams are
+    independent and a run is reproducible from its seed (given the same
+    sequence of run sizes).
+    """
+    
+    def __init__(self, x, seed=None, block_size=256, sampler=random_trials):
+        self.x = np.asarray(x, dtype=float)
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.block_size = block_size
+        self.sampler = sampler
+        self.n_trials = 0
+        self.mean = np.zeros(len(self.x))
+        self.m2 = np.zeros(len(self.x))  # Sum of squared deviations from the mean
+    
+    def run(self, n_trials):
+        """Draw n_trials more trials, fold them into the statistics and return them"""
+        blocks = []
+        while n_trials > 0:
+            size = min(n_trials, self.block_size)
+            rng = np.random.default_rng(self.seed_sequence.spawn(1)[0])
+            blocks.append(self.sampler(self.x, size, rng))
+            self.add(blocks[-1])
+            n_trials -= size
+        return np.concatenate(blocks) if blocks else np.zeros((0, len(self.x)))
+    
+    def add(self, trials):
+        """Fold an (n, len(x)) array of trials into the running mean and variance"""
+        n_new = len(trials)
+        if n_new == 0:
+            return
+        batch_mean = trials.mean(axis=0)
+        batch_m2 = ((trials - batch_mean) ** 2).sum(axis=0)
+        n_total = self.n_trials + n_new
+        delta = batch_mean - self.mean
+        self.mean = self.mean + delta * n_new / n_total
+        self.m2 = self.m2 + batch_m2 + delta ** 2 * self.n_trials * n_new / n_total
+        self.n_trials = n_total
+    
+    @property
+    def variance(self):
+        """Sample variance of the trials at each x"""
+        return self.m2 / max(self.n_trials - 1, 1)
+    
+    def confidence_band(self, z=1.96):
+        """(lower, upper) bound of the mean at each x, z standard errors wide"""
+        stderr = np.sqrt(self.variance / max(self.n_trials, 1))
+        return self.mean - z * stderr, self.mean + z * stderr
+
+
 class TrialAveraging(MovingCameraScene):
     def construct(self):
         # --- CAMERA SETTINGS ---
@@ -70,14 +149,14 @@ class TrialAveraging(MovingCameraScene):
         # --- DRAW CURVE ---
         # Sample the wobbly curve function
         x_samples = np.linspace(0, 10, 300)
-        y_samples = np.array([wobbly_curve(x) for x in x_samples])
+        y_samples = wobbly_curve(x_samples)
         
         # Create curve points
-        curve_points = np.array([[x, y, 0] for x, y in zip(x_samples, y_samples)])
+        curve_points = np.stack([x_samples, y_samples, np.zeros_like(x_samples)], axis=1)
         
         # Create and display the curve
         curve = VMobject(stroke_color="#AFCBCF", stroke_width=4)
-        curve.set_points_as_corners(curve_points)
+        curve.set_points_as_corners(simplify_curve(curve_points, frame_width=14))
         
         self.play(Create(curve), run_time=2)
         
@@ -88,14 +167,14 @@ class TrialAveraging(MovingCameraScene):
         self.add(trial_2_text)
         
         # Sample the second wobbly curve function
-        y_samples2 = np.array([wobbly_curve2(x) for x in x_samples])
+        y_samples2 = wobbly_curve2(x_samples)
         
         # Create curve points
-        curve_points2 = np.array([[x, y, 0] for x, y in zip(x_samples, y_samples2)])
+        curve_points2 = np.stack([x_samples, y_samples2, np.zeros_like(x_samples)], axis=1)
         
         # Create and display the second curve
         curve2 = VMobject(stroke_color="#AFCBCF", stroke_width=4)
-        curve2.set_points_as_corners(curve_points2)
+        curve2.set_points_as_corners(simplify_curve(curve_points2, frame_width=14))
         
         self.play(Create(curve2), run_time=2)
         
@@ -106,14 +185,14 @@ class TrialAveraging(MovingCameraScene):
         self.add(trial_3_text)
         
         # Sample the third wobbly curve function
-        y_samples3 = np.array([wobbly_curve3(x) for x in x_samples])
+        y_samples3 = wobbly_curve3(x_samples)
         
         # Create curve points
-        curve_points3 = np.array([[x, y, 0] for x, y in zip(x_samples, y_samples3)])
+        curve_points3 = np.stack([x_samples, y_samples3, np.zeros_like(x_samples)], axis=1)
         
         # Create and display the third curve
         curve3 = VMobject(stroke_color="#AFCBCF", stroke_width=4)
-        curve3.set_points_as_corners(curve_points3)
+        curve3.set_points_as_corners(simplify_curve(curve_points3, frame_width=14))
         
         self.play(Create(curve3), run_time=2)
         
@@ -131,17 +210,17 @@ class TrialAveraging(MovingCameraScene):
         # --- DRAW AVERAGE CURVE ---
         # Calculate the average of the three unshifted curves
         y_samples_avg = (
-            np.array([wobbly_curve(x, shift=0) for x in x_samples]) +
-            np.array([wobbly_curve2(x, shift=0) for x in x_samples]) +
-            np.array([wobbly_curve3(x, shift=0) for x in x_samples])
+            wobbly_curve(x_samples, shift=0) +
+            wobbly_curve2(x_samples, shift=0) +
+            wobbly_curve3(x_samples, shift=0)
         ) / 3
         
         # Create average curve points
-        curve_points_avg = np.array([[x, y, 0] for x, y in zip(x_samples, y_samples_avg)])
+        curve_points_avg = np.stack([x_samples, y_samples_avg, np.zeros_like(x_samples)], axis=1)
         
         # Create and display the average curve in contrast orange
         curve_avg = VMobject(stroke_color="#E79E16", stroke_width=10)
-        curve_avg.set_points_as_corners(curve_points_avg)
+        curve_avg.set_points_as_corners(simplify_curve(curve_points_avg, frame_width=14))
         
         self.play(Create(curve_avg), run_time=2)
         
@@ -150,4 +229,89 @@ class TrialAveraging(MovingCameraScene):
         avg_text.move_to([11.5, 0, 0])
         self.add(avg_text)
         
-        self.wait(2)
\ No newline at end of file
+        self.wait(2)
+
+
+class TrialConvergence(MovingCameraScene):
+    """
+    Many random trials converging to their average.
+    
+    Trials come from a TrialEngine and are drawn faintly as one batched
+    mobject; the running mean and its confidence band morph in place as
+    the number of trials grows.
+    """
+    # Total number of trials after each round
+    rounds = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000]
+    max_drawn_trials = 200  # Later trials only update the mean and band
+    seed = 1
+    baseline = 4  # y of the curves' zero line
+    
+    def setup(self):
+        super().setup()
+        prewarm_labels([(self.trials_text(n), 48, "#AFCBCF", "sans-serif") for n in self.rounds]
+                       + [("average", 48, "#E79E16", "sans-serif")])
+    
+    def trials_text(self, n_trials):
+        return f"{n_trials} trial" + ("s" if n_trials > 1 else "")
+    
+    def to_points(self, y_samples):
+        """Scene points of curves sampled at self.x_samples (any leading shape)"""
+        y_samples = np.asarray(y_samples) + self.baseline
+        x_samples = np.broadcast_to(self.x_samples, y_samples.shape)
+        return np.stack([x_samples, y_samples, np.zeros_like(y_samples)], axis=-1)
+    
+    def band_points(self):
+        """Closed outline of the confidence band: upper bound, then lower bound reversed"""
+        lower, upper = self.engine.confidence_band()
+        outline = np.concatenate([self.to_points(upper), self.to_points(lower)[::-1]])
+        return corner_points(np.concatenate([outline, outline[:1]]))
+    
+    def construct(self):
+        # --- CAMERA SETTINGS ---
+        self.camera.frame.set_width(14)
+        self.camera.frame.move_to([6, 6, 0])
+        self.camera.background_color = "#1a1a1a"
+        
+        self.x_samples = np.linspace(0, 10, 300)
+        self.engine = TrialEngine(self.x_samples, seed=self.seed)
+        
+        # All drawn trials in one mobject, one subpath per trial
+        trials = BatchedVMobject(stroke_color="#AFCBCF", stroke_width=2, stroke_opacity=0.15)
+        mean_curve = VMobject(stroke_color="#E79E16", stroke_width=10)
+        band = VMobject(stroke_width=0, fill_color="#E79E16", fill_opacity=0.25)
+        counter = None
+        
+        self.wait(0.5)
+        for n_total in self.rounds:
+            new_trials = self.engine.run(n_total - self.engine.n_trials)
+            n_drawn = max(min(self.max_drawn_trials - (n_total - len(new_trials)), len(new_trials)), 0)
+            for trial in self.to_points(new_trials[:n_drawn]):
+                trials.append_subpaths(corner_points(simplify_curve(trial, frame_width=14)))
+            
+            new_counter = label(self.trials_text(n_total), font_size=48, color="#AFCBCF", font="sans-serif")
+            new_counter.move_to([11.25, 10, 0])
+            if counter is not None:
+                self.remove(counter)
+            self.add(new_counter)
+            counter = new_counter
+            
+            mean_points = corner_points(self.to_points(self.engine.mean))
+            if n_total == self.rounds[0]:
+                self.add(trials, band)
+                mean_curve.points = mean_points
+                self.play(Create(mean_curve), run_time=2)
+            else:
+                band_points = self.band_points()
+                if len(band.points) == 0:
+                    band.points = band_points
+                    self.play(FadeIn(band), MorphPoints(mean_curve, mean_points), run_time=1)
+                else:
+                    self.play(MorphPoints(band, band_points), MorphPoints(mean_curve, mean_points),
+                              run_time=1)
+            self.wait(0.5)
+        
+        avg_text = label("average", font_size=48, color="#E79E16", font="sans-serif")
+        avg_text.move_to([11.5, self.baseline, 0])
+        self.add(avg_text)
+        
+        self.wait(2)